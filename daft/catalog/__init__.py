@@ -39,6 +39,9 @@ df2 = daft.sql("SELECT * FROM my_table")
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import sys
 import warnings
 
 from abc import ABC, abstractmethod
@@ -52,6 +55,8 @@ from typing import TYPE_CHECKING, Any, Literal, overload
 from daft.logical.schema import Schema
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from daft.utils import ColumnInputType
     from daft.convert import InputListType
 
@@ -67,6 +72,26 @@ __all__ = [
 Properties = dict[str, Any]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_iceberg_catalog_cls() -> type[Catalog] | None:
+    """Imports the iceberg catalog implementation once per process, returning None when unavailable."""
+    if importlib.util.find_spec("pyiceberg") is None:
+        return None
+    from daft.catalog.__iceberg import IcebergCatalog
+
+    return IcebergCatalog
+
+
+@functools.lru_cache(maxsize=None)
+def _load_unity_catalog_cls() -> type[Catalog] | None:
+    """Imports the unity catalog implementation once per process, returning None when unavailable."""
+    if importlib.util.find_spec("unitycatalog") is None:
+        return None
+    from daft.catalog.__unity import UnityCatalog
+
+    return UnityCatalog
+
+
 class NotFoundError(Exception):
     """Raised when some catalog object is not able to be found."""
 
@@ -202,12 +227,9 @@ class Catalog(ABC):
             >>> iceberg_catalog = load_catalog("my_iceberg_catalog")
             >>> catalog = Catalog.from_iceberg(iceberg_catalog)
         """
-        try:
-            from daft.catalog.__iceberg import IcebergCatalog
-
-            return IcebergCatalog._from_obj(catalog)
-        except ImportError:
+        if (cls := _load_iceberg_catalog_cls()) is None:
             raise ImportError("Iceberg support not installed: pip install -U 'daft[iceberg]'")
+        return cls._from_obj(catalog)
 
     @staticmethod
     def from_unity(catalog: object) -> Catalog:
@@ -225,12 +247,9 @@ class Catalog(ABC):
             >>> catalog = Catalog.from_unity(unity_client)
 
         """
-        try:
-            from daft.catalog.__unity import UnityCatalog
-
-            return UnityCatalog._from_obj(catalog)
-        except ImportError:
+        if (cls := _load_unity_catalog_cls()) is None:
             raise ImportError("Unity support not installed: pip install -U 'daft[unity]'")
+        return cls._from_obj(catalog)
 
     @staticmethod
     def from_s3tables(
@@ -495,15 +514,40 @@ class Catalog(ABC):
         return f"Catalog('{self.name}')"
 
 
-class Identifier(Sequence[str]):
+@functools.lru_cache(maxsize=1024)
+def _from_sql_cached(input: str, normalize: bool) -> PyIdentifier:
+    """Parses a PyIdentifier from an SQL string, caching results since identifiers are immutable.
+
+    Note that normalization happens on the native side even for ASCII-only inputs, where
+    full Unicode normalization is unnecessary; the cache means any given input only pays
+    that cost once per process, so an ASCII-specialized native entry point has not been
+    worth adding.
+    """
+    return PyIdentifier.from_sql(input, normalize)
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_str_cached(input: str) -> Identifier:
+    """Parses an Identifier from a dot-delimited string, caching results since identifiers are immutable."""
+    return Identifier(*input.split("."))
+
+
+class Identifier:
     """A reference (path) to a catalog object.
 
+    Identifiers are immutable; `_ident` must not be mutated after construction.
+
     Examples:
         >>> id = Identifier("a", "b")
         >>> assert len(id) == 2
     """
 
-    _ident: PyIdentifier
+    __slots__ = ("_hash", "_parts", "_pyident", "_repr")
+
+    _hash: int | None
+    _parts: tuple[str, ...]
+    _pyident: PyIdentifier | None
+    _repr: str | None
 
     def __init__(self, *parts: str):
         """Creates an Identifier from its parts.
@@ -512,16 +556,37 @@ class Identifier(Sequence[str]):
             >>> from daft.catalog import Identifier
             >>> Identifier("namespace", "table")
         """
-        if len(parts) < 1:
+        if not parts:
             raise ValueError("Identifier requires at least one part.")
-        self._ident = PyIdentifier(parts)
+        # Intern the parts so identifiers sharing namespace components (e.g. thousands of
+        # tables under one schema) reference a single copy of each string.
+        parts = tuple(sys.intern(part) if type(part) is str else part for part in parts)
+        self._parts = parts
+        self._pyident = None
+        self._hash = None
+        self._repr = None
 
     @staticmethod
     def _from_pyidentifier(ident: PyIdentifier) -> Identifier:
         i = Identifier.__new__(Identifier)
-        i._ident = ident
+        i._pyident = ident
+        i._parts = tuple(sys.intern(ident.getitem(index)) for index in range(ident.__len__()))
+        i._hash = None
+        i._repr = None
         return i
 
+    @property
+    def _ident(self) -> PyIdentifier:
+        """Returns the native PyIdentifier, building it on first use.
+
+        Pure-Python operations work off `_parts`, so identifiers that never cross into
+        native code (e.g. speculative resolutions) skip the PyO3 allocation entirely.
+        """
+        ident = self._pyident
+        if ident is None:
+            ident = self._pyident = PyIdentifier(self._parts)
+        return ident
+
     @staticmethod
     def from_sql(input: str, normalize: bool = False) -> Identifier:
         """Parses an Identifier from an SQL string, normalizing to lowercase if specified.
@@ -540,9 +605,7 @@ class Identifier(Sequence[str]):
             >>> Identifier.from_sql('ABC."xYz"', normalize=True) == Identifier("abc", "xYz")
 
         """
-        i = Identifier.__new__(Identifier)
-        i._ident = PyIdentifier.from_sql(input, normalize)
-        return i
+        return Identifier._from_pyidentifier(_from_sql_cached(input, normalize))
 
     @staticmethod
     def from_str(input: str) -> Identifier:
@@ -559,7 +622,7 @@ class Identifier(Sequence[str]):
             >>> Identifier.from_str("namespace.table") == Identifier("namespace", "table")
 
         """
-        return Identifier(*input.split("."))
+        return _from_str_cached(input)
 
     def drop(self, n: int = 1) -> Identifier:
         """Returns a new Identifier with the first n parts removed.
@@ -573,17 +636,25 @@ class Identifier(Sequence[str]):
         Raises:
             ValueError: If dropping n parts would result in an empty Identifier.
         """
+        parts = self._parts
         if n <= 0:
-            return Identifier(*self)
-        if n >= len(self):
-            raise ValueError(f"Cannot drop {n} parts from Identifier with {len(self)} parts")
-        parts = tuple(self)
+            return Identifier(*parts)
+        if n >= len(parts):
+            raise ValueError(f"Cannot drop {n} parts from Identifier with {len(parts)} parts")
         return Identifier(*parts[n:])
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Identifier):
             return False
-        return self._ident.eq(other._ident)
+        return self._parts == other._parts
+
+    def __hash__(self) -> int:
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self._parts)
+        return h
 
     @overload
     def __getitem__(self, index: int, /) -> str: ...
@@ -592,22 +663,48 @@ class Identifier(Sequence[str]):
     def __getitem__(self, index: slice, /) -> Sequence[str]: ...
 
     def __getitem__(self, index: int | slice, /) -> str | Sequence[str]:
-        if isinstance(index, int):
-            return self._ident.getitem(index)
-        parts = tuple(self)
-        return parts[index]
+        return self._parts[index]
 
     def __len__(self) -> int:
-        return self._ident.__len__()
+        return len(self._parts)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parts)
+
+    def __contains__(self, part: object) -> bool:
+        return part in self._parts
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(self._parts)
+
+    def index(self, part: str, start: int = 0, stop: int = sys.maxsize, /) -> int:
+        return self._parts.index(part, start, stop)
+
+    def count(self, part: str, /) -> int:
+        return self._parts.count(part)
 
     def __add__(self, suffix: Identifier) -> Identifier:
-        return Identifier(*(tuple(self) + tuple(suffix)))
+        return Identifier(*self._parts, *suffix._parts)
+
+    def __reduce__(self) -> tuple[type[Identifier], tuple[str, ...]]:
+        # Pickle as the parts tuple and rebuild through __init__, avoiding any
+        # native-side serialization of the wrapped PyIdentifier.
+        return (Identifier, self._parts)
 
     def __repr__(self) -> str:
-        return f"Identifier('{self._ident.__repr__()}')"
+        r = self._repr
+        if r is None:
+            r = self._repr = f"Identifier('{self._ident.__repr__()}')"
+        return r
 
     def __str__(self) -> str:
-        return ".".join(self)
+        return ".".join(self._parts)
+
+
+# Identifier implements the Sequence protocol directly off its parts tuple (including the
+# index/count mixin methods) rather than inheriting the ABC mixins, which would route
+# iteration through indexed __getitem__ calls.
+Sequence.register(Identifier)
 
 
 class Table(ABC):
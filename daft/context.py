@@ -63,6 +63,22 @@ def get_context() -> DaftContext:
     return DaftContext(_get_context())
 
 
+_default_io_config_cache: IOConfig | None = None
+
+
+def _default_io_config() -> IOConfig:
+    """Returns the default IOConfig from the current planning config.
+
+    Memoized until `set_planning_config` replaces the planning config, since resolving it
+    crosses into the native context on every call.
+    """
+    global _default_io_config_cache
+    config = _default_io_config_cache
+    if config is None:
+        config = _default_io_config_cache = get_context().daft_planning_config.default_io_config
+    return config
+
+
 def set_runner_ray(
     address: str | None = None,
     noop_if_initialized: bool = False,
@@ -143,6 +159,8 @@ def set_planning_config(
         )
 
         ctx._ctx._daft_planning_config = new_daft_planning_config
+        global _default_io_config_cache
+        _default_io_config_cache = None
         return ctx
 
 
@@ -1,6 +1,6 @@
 import builtins
 import datetime
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterator, Iterator, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Callable, Literal, TypeVar
 
@@ -1121,9 +1121,11 @@ class PyField:
 class PySchema:
     def __getitem__(self, name: str) -> PyField: ...
     def names(self) -> list[str]: ...
+    def float_column_names(self) -> list[str]: ...
     def union(self, other: PySchema) -> PySchema: ...
     def __eq__(self, other: object) -> bool: ...
     def estimate_row_size_bytes(self) -> float: ...
+    def fingerprint(self) -> int: ...
     @staticmethod
     def from_field_name_and_types(names_and_types: list[tuple[str, PyDataType]]) -> PySchema: ...
     @staticmethod
@@ -1671,10 +1673,13 @@ class LogicalPlanBuilder:
     def with_planning_config(self, daft_planning_config: PyDaftPlanningConfig) -> LogicalPlanBuilder: ...
     def select(self, to_select: list[PyExpr]) -> LogicalPlanBuilder: ...
     def with_columns(self, columns: list[PyExpr]) -> LogicalPlanBuilder: ...
+    def with_columns_named(self, names: list[str], columns: list[PyExpr]) -> LogicalPlanBuilder: ...
     def with_columns_renamed(self, cols_map: dict[str, str]) -> LogicalPlanBuilder: ...
-    def exclude(self, to_exclude: list[str]) -> LogicalPlanBuilder: ...
+    def exclude(self, to_exclude: Sequence[str]) -> LogicalPlanBuilder: ...
     def filter(self, predicate: PyExpr) -> LogicalPlanBuilder: ...
     def limit(self, limit: int, eager: bool) -> LogicalPlanBuilder: ...
+    def is_provably_empty(self) -> bool: ...
+    def num_rows_from_stats(self) -> int | None: ...
     def shard(self, strategy: str, world_size: int, rank: int) -> LogicalPlanBuilder: ...
     def explode(self, to_explode: list[PyExpr]) -> LogicalPlanBuilder: ...
     def unpivot(
@@ -1696,6 +1701,7 @@ class LogicalPlanBuilder:
     def distinct(self, on: list[PyExpr]) -> LogicalPlanBuilder: ...
     def sample(self, fraction: float, with_replacement: bool, seed: int | None) -> LogicalPlanBuilder: ...
     def aggregate(self, agg_exprs: list[PyExpr], groupby_exprs: list[PyExpr]) -> LogicalPlanBuilder: ...
+    def agg_all(self, op: str, exprs: list[PyExpr], groupby_exprs: list[PyExpr]) -> LogicalPlanBuilder: ...
     def pivot(
         self,
         groupby_exprs: list[PyExpr],
@@ -1714,6 +1720,12 @@ class LogicalPlanBuilder:
         prefix: str | None = None,
         suffix: str | None = None,
     ) -> LogicalPlanBuilder: ...
+    def cross_join(
+        self,
+        right: LogicalPlanBuilder,
+        prefix: str | None = None,
+        suffix: str | None = None,
+    ) -> LogicalPlanBuilder: ...
     def concat(self, other: LogicalPlanBuilder) -> LogicalPlanBuilder: ...
     def union(self, other: LogicalPlanBuilder, is_all: bool, is_by_name: bool) -> LogicalPlanBuilder: ...
     def intersect(self, other: LogicalPlanBuilder, is_all: bool) -> LogicalPlanBuilder: ...
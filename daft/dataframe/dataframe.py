@@ -15,19 +15,20 @@ import warnings
 from collections.abc import Iterable, Iterator, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from functools import partial, reduce
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, TypeVar, Union, overload
+from functools import cached_property, lru_cache, reduce
+from typing import TYPE_CHECKING, Any, Callable, Literal, NoReturn, Optional, TypeVar, Union, overload
 
 from daft.api_annotations import DataframePublicAPI
-from daft.context import get_context
+from daft.context import _default_io_config, get_context
 from daft.convert import InputListType
 from daft.daft import FileFormat, IOConfig, JoinStrategy, JoinType, WriteMode
 from daft.dataframe.display import MermaidOptions
 from daft.dataframe.preview import Preview, PreviewAlign, PreviewColumn, PreviewFormat, PreviewFormatter
 from daft.datatype import DataType
+from daft.dependencies import pa
 from daft.errors import ExpressionTypeError
 from daft.execution.native_executor import NativeExecutor
-from daft.expressions import Expression, ExpressionsProjection, col, lit
+from daft.expressions import Expression, ExpressionsProjection, col, list_, lit
 from daft.logical.builder import LogicalPlanBuilder
 from daft.recordbatch import MicroPartition
 from daft.runners.partitioning import (
@@ -66,6 +67,24 @@ R = TypeVar("R")
 P = ParamSpec("P")
 
 
+def _build_in_memory_scan(parts: tuple[MicroPartition, ...]) -> tuple[LogicalPlanBuilder, PartitionCacheEntry]:
+    """Puts MicroPartitions into the partition cache and builds an in-memory scan over them."""
+    if not parts:
+        raise ValueError("Can't create a DataFrame from an empty list of tables.")
+
+    result_pset = LocalPartitionSet.from_tables(parts)
+
+    context = get_context()
+    cache_entry = context.get_or_create_runner().put_partition_set_into_cache(result_pset)
+    num_partitions, size_bytes, num_rows = result_pset.stats()
+
+    assert size_bytes is not None, "In-memory data should always have non-None size in bytes"
+    builder = LogicalPlanBuilder.from_in_memory_scan(
+        cache_entry, parts[0].schema(), num_partitions, size_bytes, num_rows=num_rows
+    )
+    return builder, cache_entry
+
+
 def to_logical_plan_builder(*parts: MicroPartition) -> LogicalPlanBuilder:
     """Creates a Daft DataFrame from a single RecordBatch.
 
@@ -75,27 +94,88 @@ def to_logical_plan_builder(*parts: MicroPartition) -> LogicalPlanBuilder:
     Returns:
         DataFrame: Daft DataFrame created from the provided Table.
     """
-    if not parts:
-        raise ValueError("Can't create a DataFrame from an empty list of tables.")
+    builder, _ = _build_in_memory_scan(parts)
+    return builder
 
-    result_pset = LocalPartitionSet()
 
-    for i, part in enumerate(parts):
-        result_pset.set_partition_from_table(i, part)
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
 
-    context = get_context()
-    cache_entry = context.get_or_create_runner().put_partition_set_into_cache(result_pset)
-    size_bytes = result_pset.size_bytes()
-    num_rows = len(result_pset)
 
-    assert size_bytes is not None, "In-memory data should always have non-None size in bytes"
-    return LogicalPlanBuilder.from_in_memory_scan(
-        cache_entry, parts[0].schema(), result_pset.num_partitions(), size_bytes, num_rows=num_rows
-    )
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> Any:
+    """Memoized `packaging.version.parse`, used by the version gates in the write methods."""
+    from packaging.version import parse
 
+    return parse(version)
 
-def _utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+
+# Accepted tabular write modes, mapped to their native enum up front so the write methods
+# validate and convert with a single dict lookup.
+_WRITE_MODES = {
+    "append": WriteMode.Append,
+    "overwrite": WriteMode.Overwrite,
+    "overwrite-partitions": WriteMode.OverwritePartitions,
+}
+
+
+def _single_row_path_df(file_path: str) -> "DataFrame":
+    """Builds the one-row `path` result returned by the tabular write methods' empty branch."""
+    return DataFrame._from_micropartitions(MicroPartition.from_pydict({"path": [file_path]}))
+
+
+def _column_input_to_expression(c: ColumnInputType) -> Expression:
+    return col(c) if isinstance(c, str) else c
+
+
+def _balanced_reduce(op: Callable[[Expression, Expression], Expression], exprs: list[Expression]) -> Expression:
+    """Combines expressions pairwise into a log-depth tree.
+
+    functools.reduce builds a left-deep chain whose depth equals the expression count,
+    which planner passes then recurse through; on wide tables the balanced shape keeps
+    tree walks shallow.
+    """
+    while len(exprs) > 1:
+        reduced = [op(a, b) for a, b in zip(exprs[::2], exprs[1::2])]
+        if len(exprs) % 2:
+            reduced.append(exprs[-1])
+        exprs = reduced
+    return exprs[0]
+
+
+@lru_cache(maxsize=1024)
+def _cached_sql_expr(predicate: str) -> Expression:
+    """Memoized SQL-string parsing for `where`; Expressions are immutable plan fragments, so repeated predicate strings can share the parsed result."""
+    from daft.sql.sql import sql_expr
+
+    return sql_expr(predicate)
+
+
+# Number of salt buckets heavy keys are spread over when `join` is given `skew_hints`:
+# each hinted key's rows are split across this many partitions instead of stalling one.
+_SKEWED_JOIN_REPLICATION_FACTOR = 8
+
+
+# Aggregation methods whose default-argument form `_apply_agg_fn` can batch into a single
+# Rust-side builder call instead of constructing one agg Expression per column over FFI.
+_AGG_ALL_OPS: dict[Callable[[Expression], Expression], str] = {
+    Expression.sum: "sum",
+    Expression.mean: "mean",
+    Expression.stddev: "stddev",
+    Expression.min: "min",
+    Expression.max: "max",
+    Expression.any_value: "any_value",
+    Expression.count: "count",
+    Expression.skew: "skew",
+    Expression.agg_list: "agg_list",
+    Expression.agg_set: "agg_set",
+    Expression.agg_concat: "agg_concat",
+}
+
+
+# Shared empty preview assigned to every new DataFrame; Preview is a frozen dataclass, so a
+# single instance can stand in for "not yet populated" without per-constructor allocations.
+_EMPTY_PREVIEW = Preview(partition=None, total_rows=None)
 
 
 class DataFrame:
@@ -112,48 +192,93 @@ class DataFrame:
         Args:
             plan: LogicalPlan describing the steps required to arrive at this DataFrame
         """
-        if not isinstance(builder, LogicalPlanBuilder):
-            if isinstance(builder, dict):
-                raise ValueError(
-                    "DataFrames should be constructed with a dictionary of columns using `daft.from_pydict`"
-                )
-            if isinstance(builder, list):
-                raise ValueError(
-                    "DataFrames should be constructed with a list of dictionaries using `daft.from_pylist`"
-                )
-            raise ValueError(f"Expected DataFrame to be constructed with a LogicalPlanBuilder, received: {builder}")
+        # Exact-type check keeps the common path to a single pointer comparison; the
+        # out-of-line raiser handles the nice per-type error messages (and any
+        # LogicalPlanBuilder subclasses) on the cold path.
+        if type(builder) is not LogicalPlanBuilder and not isinstance(builder, LogicalPlanBuilder):
+            DataFrame.__raise_invalid_builder(builder)
 
         self.__builder = builder
+        self.__schema: Optional[Schema] = None
+        self.__optimized_builder: Optional[LogicalPlanBuilder] = None
         self._result_cache: Optional[PartitionCacheEntry] = None
-        self._preview = Preview(partition=None, total_rows=None)
-        self._num_preview_rows = get_context().daft_execution_config.num_preview_rows
+        self.__result_builder: Optional[tuple[PartitionCacheEntry, LogicalPlanBuilder]] = None
+        self._preview = _EMPTY_PREVIEW
+        # Resolved lazily by `_get_num_preview_rows` so that intermediate DataFrames which
+        # are never displayed skip the context/execution-config lookup entirely.
+        self._num_preview_rows: Optional[int] = None
+        # Lazily-created memo of string column inputs -> parsed Expressions for the agg
+        # entry points; safe to scope per instance since this frame's schema is fixed.
+        self.__agg_expr_cache: Optional[dict[tuple[str, ...], list[Expression]]] = None
+
+    @staticmethod
+    def __raise_invalid_builder(builder: Any) -> NoReturn:
+        if isinstance(builder, dict):
+            raise ValueError("DataFrames should be constructed with a dictionary of columns using `daft.from_pydict`")
+        if isinstance(builder, list):
+            raise ValueError("DataFrames should be constructed with a list of dictionaries using `daft.from_pylist`")
+        raise ValueError(f"Expected DataFrame to be constructed with a LogicalPlanBuilder, received: {builder}")
+
+    def _get_num_preview_rows(self) -> int:
+        """Returns the number of preview rows, deferring the execution-config lookup until first use."""
+        num_preview_rows = self._num_preview_rows
+        if num_preview_rows is None:
+            num_preview_rows = self._num_preview_rows = get_context().daft_execution_config.num_preview_rows
+        return num_preview_rows
 
     @property
     def _builder(self) -> LogicalPlanBuilder:
-        if self._result_cache is None:
+        result_cache = self._result_cache
+        if result_cache is None:
             return self.__builder
         else:
-            num_partitions = self._result_cache.num_partitions()
-            size_bytes = self._result_cache.size_bytes()
-            num_rows = self._result_cache.num_rows()
+            # This property is read on every streaming/execution entry point, so reuse the
+            # in-memory scan builder constructed for this cache entry rather than rebuilding it
+            # (and re-querying the cache entry's metadata) per access.
+            cached = self.__result_builder
+            if cached is not None and cached[0] is result_cache:
+                return cached[1]
+
+            num_partitions, size_bytes, num_rows = result_cache.metadata()
 
             # Partition set should always be set on cache entry.
             assert (
                 num_partitions is not None and size_bytes is not None and num_rows is not None
             ), "Partition set should always be set on cache entry"
 
-            return self.__builder.from_in_memory_scan(
-                self._result_cache,
+            builder = self.__builder.from_in_memory_scan(
+                result_cache,
                 self.__builder.schema(),
                 num_partitions=num_partitions,
                 size_bytes=size_bytes,
                 num_rows=num_rows,
             )
+            self.__result_builder = (result_cache, builder)
+            return builder
 
     def _get_current_builder(self) -> LogicalPlanBuilder:
         """Returns the current logical plan builder, without any caching optimizations."""
         return self.__builder
 
+    def _detach_from_result(self) -> "DataFrame":
+        """Rebases this DataFrame onto the in-memory scan over its materialized result and returns it.
+
+        Used by the write methods: instead of allocating a fresh DataFrame and copying the result
+        cache and preview across, swap this frame's plan for the cached-result scan so it behaves
+        like a plain data frame disconnected from the write sink.
+        """
+        assert self._result_cache is not None
+        self.__builder = self._builder
+        self.__optimized_builder = None
+        return self
+
+    def _optimized_builder(self) -> LogicalPlanBuilder:
+        """Returns the optimized logical plan, memoized since the underlying plan is immutable."""
+        optimized = self.__optimized_builder
+        if optimized is None:
+            optimized = self.__optimized_builder = self.__builder.optimize()
+        return optimized
+
     @property
     def _result(self) -> Optional[PartitionSet[PartitionT]]:
         if self._result_cache is None:
@@ -162,6 +287,13 @@ class DataFrame:
             return self._result_cache.value
 
     def _broadcast_query_plan(self) -> None:
+        # Cheap no-op fast path: the dashboard is off unless this env var is set (the name
+        # mirrors native.DAFT_DASHBOARD_ENV_ENABLED), so skip the module import and the
+        # full _should_run validation entirely in the common disabled case. The env var is
+        # re-read per call since dashboard.launch() can enable it at runtime.
+        if not os.environ.get("DAFT_DASHBOARD_ENABLED"):
+            return
+
         from daft import dashboard
 
         if not dashboard._should_run():
@@ -255,25 +387,28 @@ class DataFrame:
                 # if we are not in a notebook, we return the raw markdown instead of the class instance
                 return repr(instance)
 
-        print_to_file = partial(print, file=file)
+        # Buffer the output and write it with a single print call, rather than paying a
+        # lock-and-flush per section.
+        lines: list[str] = []
 
         if self._result_cache is not None:
-            print_to_file("Result is cached and will skip computation\n")
-            print_to_file(self._builder.pretty_print(simple, format=format))
+            lines.append("Result is cached and will skip computation\n")
+            lines.append(self._builder.pretty_print(simple, format=format))
 
-            print_to_file("However here is the logical plan used to produce this result:\n", file=file)
+            lines.append("However here is the logical plan used to produce this result:\n")
 
         builder = self.__builder
-        print_to_file("== Unoptimized Logical Plan ==\n")
-        print_to_file(builder.pretty_print(simple, format=format))
+        lines.append("== Unoptimized Logical Plan ==\n")
+        lines.append(builder.pretty_print(simple, format=format))
         if show_all:
-            print_to_file("\n== Optimized Logical Plan ==\n")
-            builder = builder.optimize()
-            print_to_file(builder.pretty_print(simple))
-            print_to_file("\n== Physical Plan ==\n")
-            if get_context().get_or_create_runner().name != "native":
+            lines.append("\n== Optimized Logical Plan ==\n")
+            builder = self._optimized_builder()
+            lines.append(builder.pretty_print(simple))
+            lines.append("\n== Physical Plan ==\n")
+            context = get_context()
+            daft_execution_config = context.daft_execution_config
+            if context.get_or_create_runner().name != "native":
                 # Check if flotilla is enabled for distributed execution
-                daft_execution_config = get_context().daft_execution_config
                 if daft_execution_config.use_experimental_distributed_engine:
                     try:
                         from daft.daft import DistributedPhysicalPlan
@@ -282,32 +417,37 @@ class DataFrame:
                             builder._builder, daft_execution_config
                         )
                         if format == "ascii":
-                            print_to_file(distributed_plan.repr_ascii(simple))
+                            lines.append(distributed_plan.repr_ascii(simple))
                         elif format == "mermaid":
-                            print_to_file(distributed_plan.repr_mermaid(MermaidOptions(simple)))
+                            lines.append(distributed_plan.repr_mermaid(MermaidOptions(simple)))
                     except Exception:
-                        physical_plan_scheduler = builder.to_physical_plan_scheduler(
-                            get_context().daft_execution_config
-                        )
-                        print_to_file(physical_plan_scheduler.pretty_print(simple, format=format))
+                        physical_plan_scheduler = builder.to_physical_plan_scheduler(daft_execution_config)
+                        lines.append(physical_plan_scheduler.pretty_print(simple, format=format))
                 else:
-                    physical_plan_scheduler = builder.to_physical_plan_scheduler(get_context().daft_execution_config)
-                    print_to_file(physical_plan_scheduler.pretty_print(simple, format=format))
+                    physical_plan_scheduler = builder.to_physical_plan_scheduler(daft_execution_config)
+                    lines.append(physical_plan_scheduler.pretty_print(simple, format=format))
             else:
                 native_executor = NativeExecutor()
-                print_to_file(
-                    native_executor.pretty_print(builder, get_context().daft_execution_config, simple, format=format)
-                )
+                lines.append(native_executor.pretty_print(builder, daft_execution_config, simple, format=format))
         else:
-            print_to_file(
-                "\n \nSet `show_all=True` to also see the Optimized and Physical plans. This will run the query optimizer.",
+            lines.append(
+                "\n \nSet `show_all=True` to also see the Optimized and Physical plans. This will run the query optimizer."
             )
+        print("\n".join(lines), file=file)
         return None
 
     def num_partitions(self) -> int:
+        # If the result is already materialized, its partition count is known without
+        # re-running the optimizer.
+        if self._result_cache is not None:
+            num_partitions = self._result_cache.num_partitions()
+            if num_partitions is not None:
+                return num_partitions
         # We need to run the optimizer since that could change the number of partitions
         return (
-            self.__builder.optimize().to_physical_plan_scheduler(get_context().daft_execution_config).num_partitions()
+            self._optimized_builder()
+            .to_physical_plan_scheduler(get_context().daft_execution_config)
+            .num_partitions()
         )
 
     @DataframePublicAPI
@@ -317,25 +457,34 @@ class DataFrame:
         Returns:
             Schema: schema of the DataFrame
         """
-        return self.__builder.schema()
+        # The builder is immutable once attached to a DataFrame, so the schema can be
+        # computed once and reused across column_names/columns/validation call sites.
+        schema = self.__schema
+        if schema is None:
+            schema = self.__schema = self.__builder.schema()
+        return schema
 
-    @property
+    @cached_property
     def column_names(self) -> list[str]:
         """Returns column names of DataFrame as a list of strings.
 
+        The DataFrame's plan is immutable, so the list is computed once and cached.
+
         Returns:
             List[str]: Column names of this DataFrame.
         """
-        return self.__builder.schema().column_names()
+        return self.schema().column_names()
 
-    @property
+    @cached_property
     def columns(self) -> list[Expression]:
         """Returns column of DataFrame as a list of Expressions.
 
+        The DataFrame's plan is immutable, so the list is computed once and cached.
+
         Returns:
             List[Expression]: Columns of this DataFrame.
         """
-        return [col(field.name) for field in self.__builder.schema()]
+        return [col(field.name) for field in self.schema()]
 
     @DataframePublicAPI
     def __iter__(self) -> Iterator[dict[str, Any]]:
@@ -387,15 +536,25 @@ class DataFrame:
             results_buffer_size = multiprocessing.cpu_count()
 
         def arrow_iter_rows(table: "pyarrow.Table") -> Iterator[dict[str, Any]]:
-            columns = table.columns
-            for i in range(len(table)):
-                row = {col._name: col[i] for col in columns}
-                yield row
+            # Iterate per RecordBatch so each element access indexes a contiguous Array
+            # instead of a ChunkedArray, which pays a chunk lookup per (column, row) pair.
+            names = table.schema.names
+            for batch in table.to_batches():
+                columns = batch.columns
+                for i in range(batch.num_rows):
+                    yield dict(zip(names, (column[i] for column in columns)))
 
         def python_iter_rows(pydict: dict[str, list[Any]], num_rows: int) -> Iterator[dict[str, Any]]:
-            for i in range(num_rows):
-                row = {key: value[i] for (key, value) in pydict.items()}
-                yield row
+            keys = tuple(pydict)
+            if not keys:
+                # Zero-column frames can still carry rows.
+                for _ in range(num_rows):
+                    yield {}
+                return
+            # zip(*columns) advances all column lists in C, avoiding a Python-level
+            # index-and-lookup per (column, row) pair.
+            for values in zip(*pydict.values()):
+                yield dict(zip(keys, values))
 
         if self._result is not None:
             # If the dataframe has already finished executing,
@@ -432,11 +591,10 @@ class DataFrame:
         results_buffer_size: Union[Optional[int], Literal["num_cpus"]] = "num_cpus",
     ) -> Iterator["pyarrow.RecordBatch"]:
         """Return an iterator of pyarrow recordbatches for this dataframe."""
-        for name in self.schema().column_names():
-            if self.schema()[name].dtype.is_python():
-                raise ValueError(
-                    f"Cannot convert column {name} to Arrow type, found Python type: {self.schema()[name].dtype}"
-                )
+        schema = self.schema()
+        for field in schema:
+            if field.dtype.is_python():
+                raise ValueError(f"Cannot convert column {field.name} to Arrow type, found Python type: {field.dtype}")
 
         if results_buffer_size == "num_cpus":
             results_buffer_size = multiprocessing.cpu_count()
@@ -530,7 +688,7 @@ class DataFrame:
         if results is not None:
             # If the dataframe has already finished executing,
             # use the precomputed results.
-            for mat_result in results.values():
+            for mat_result in results.iter_values():
                 yield mat_result.partition()
 
         else:
@@ -548,14 +706,11 @@ class DataFrame:
         if results is None:
             return
 
-        preview_partition_invalid = (
-            self._preview.partition is None or len(self._preview.partition) < self._num_preview_rows
-        )
+        num_preview_rows = self._get_num_preview_rows()
+        preview_partition_invalid = self._preview.partition is None or len(self._preview.partition) < num_preview_rows
         if preview_partition_invalid:
-            preview_parts = results._get_preview_micropartitions(self._num_preview_rows)
-            preview_results = LocalPartitionSet()
-            for i, part in enumerate(preview_parts):
-                preview_results.set_partition_from_table(i, part)
+            preview_parts = results._get_preview_micropartitions(num_preview_rows)
+            preview_results = LocalPartitionSet.from_tables(preview_parts)
             preview_partition = preview_results._get_merged_micropartition(self.schema())
             self._preview = Preview(
                 partition=preview_partition,
@@ -586,8 +741,27 @@ class DataFrame:
             if not isinstance(row, dict):
                 raise ValueError(f"Expected list of dictionaries of {{column_name: value}}, received: {type(row)}")
             headers.update(row.keys())
-        headers_ordered = sorted(list(headers))
-        return cls._from_pydict(data={header: [row.get(header, None) for row in data] for header in headers_ordered})
+        headers_ordered = sorted(headers)
+
+        # Fast path: pyarrow's C-implemented from_pylist does the inference and transpose in
+        # native code. Fall back to the pure-Python transpose when the rows hold values Arrow
+        # cannot represent (e.g. arbitrary Python objects or mixed types).
+        if data and pa.module_available():
+            try:
+                table = pa.Table.from_pylist(data)
+            except Exception:
+                pass
+            else:
+                if sorted(table.column_names) == headers_ordered:
+                    return cls._from_arrow(table.select(headers_ordered))
+
+        # Transpose by iterating each row's items once, rather than probing every row for
+        # every header (O(rows * headers) dict lookups for sparse/wide inputs).
+        columns: dict[str, list[Any]] = {header: [None] * len(data) for header in headers_ordered}
+        for i, row in enumerate(data):
+            for key, value in row.items():
+                columns[key][i] = value
+        return cls._from_pydict(data=columns)
 
     @classmethod
     def _from_pydict(cls, data: Mapping[str, InputListType]) -> "DataFrame":
@@ -604,7 +778,11 @@ class DataFrame:
     @classmethod
     def _from_arrow(cls, data: Union["pyarrow.Table", list["pyarrow.Table"], Iterable["pyarrow.Table"]]) -> "DataFrame":
         """Creates a DataFrame from a `pyarrow Table <https://arrow.apache.org/docs/python/generated/pyarrow.Table.html>`__."""
-        if isinstance(data, Iterable):
+        # Check for the common single-table case first so it skips the Iterable ABC check
+        # and cannot be misrouted through list() materialization.
+        if isinstance(data, pa.Table):
+            data = [data]
+        elif isinstance(data, Iterable):
             data = list(data)
         if not isinstance(data, list):
             data = [data]
@@ -629,29 +807,12 @@ class DataFrame:
         Returns:
             DataFrame: Daft DataFrame created from the provided Table.
         """
-        if not parts:
-            raise ValueError("Can't create a DataFrame from an empty list of tables.")
-
-        result_pset = LocalPartitionSet()
-
-        for i, part in enumerate(parts):
-            result_pset.set_partition_from_table(i, part)
-
-        context = get_context()
-        cache_entry = context.get_or_create_runner().put_partition_set_into_cache(result_pset)
-        size_bytes = result_pset.size_bytes()
-        num_rows = len(result_pset)
-
-        assert size_bytes is not None, "In-memory data should always have non-None size in bytes"
-        builder = LogicalPlanBuilder.from_in_memory_scan(
-            cache_entry, parts[0].schema(), result_pset.num_partitions(), size_bytes, num_rows=num_rows
-        )
+        builder, cache_entry = _build_in_memory_scan(parts)
 
         df = cls(builder)
         df._result_cache = cache_entry
 
-        # build preview
-        df._populate_preview()
+        # The preview is populated lazily by __repr__/_repr_html_ when the frame is displayed.
         return df
 
     @classmethod
@@ -664,10 +825,11 @@ class DataFrame:
         Returns:
             DataFrame: Daft DataFrame with "column_name" and "type" fields.
         """
-        pydict: dict[str, list[str]] = {"column_name": [], "type": []}
-        for field in schema:
-            pydict["column_name"].append(field.name)
-            pydict["type"].append(str(field.dtype))
+        fields = list(schema)
+        pydict: dict[str, list[str]] = {
+            "column_name": [field.name for field in fields],
+            "type": [str(field.dtype) for field in fields],
+        }
         return DataFrame._from_pydict(pydict)
 
     ###
@@ -700,51 +862,49 @@ class DataFrame:
         Note:
             This call is **blocking** and will execute the DataFrame when called
         """
-        if write_mode not in ["append", "overwrite", "overwrite-partitions"]:
+        mode_enum = _WRITE_MODES.get(write_mode)
+        if mode_enum is None:
             raise ValueError(
                 f"Only support `append`, `overwrite`, or `overwrite-partitions` mode. {write_mode} is unsupported"
             )
         if write_mode == "overwrite-partitions" and partition_cols is None:
             raise ValueError("Partition columns must be specified to use `overwrite-partitions` mode.")
 
-        io_config = get_context().daft_planning_config.default_io_config if io_config is None else io_config
+        io_config = _default_io_config() if io_config is None else io_config
 
         cols: Optional[list[Expression]] = None
         if partition_cols is not None:
             cols = self.__column_input_to_expression(tuple(partition_cols))
 
-        builder = self._builder.write_tabular(
-            root_dir=root_dir,
-            partition_cols=cols,
-            write_mode=WriteMode.from_str(write_mode),
-            file_format=FileFormat.Parquet,
-            compression=compression,
-            io_config=io_config,
-        )
-        # Block and write, then retrieve data
-        write_df = DataFrame(builder)
-        write_df.collect()
-        assert write_df._result is not None
-
-        if len(write_df) > 0:
-            # Populate and return a new disconnected DataFrame
-            result_df = DataFrame(write_df._builder)
-            result_df._result_cache = write_df._result_cache
-            result_df._preview = write_df._preview
-            return result_df
-        else:
-            from daft import from_pydict
-            from daft.recordbatch.recordbatch_io import write_empty_tabular
-
-            file_path = write_empty_tabular(
-                root_dir, FileFormat.Parquet, self.schema(), compression=compression, io_config=io_config
+        # Skip execution entirely when the plan is statically known to produce no rows
+        # (e.g. `.limit(0)`) and go straight to writing an empty file. Only append mode may
+        # skip: the overwrite modes delete pre-existing files as part of execution, which
+        # must still happen even when zero rows are written.
+        if write_mode != "append" or not self._builder.is_provably_empty():
+            builder = self._builder.write_tabular(
+                root_dir=root_dir,
+                partition_cols=cols,
+                write_mode=mode_enum,
+                file_format=FileFormat.Parquet,
+                compression=compression,
+                io_config=io_config,
             )
+            # Block and write, then retrieve data
+            write_df = DataFrame(builder)
+            write_df.collect()
+            assert write_df._result is not None
 
-            return from_pydict(
-                {
-                    "path": [file_path],
-                }
-            )
+            if len(write_df) > 0:
+                # Return the write result as a plain DataFrame, detached from the write plan.
+                return write_df._detach_from_result()
+
+        from daft.recordbatch.recordbatch_io import write_empty_tabular
+
+        file_path = write_empty_tabular(
+            root_dir, FileFormat.Parquet, self.schema(), compression=compression, io_config=io_config
+        )
+
+        return _single_row_path_df(file_path)
 
     @DataframePublicAPI
     def write_csv(
@@ -771,49 +931,47 @@ class DataFrame:
             This call is **blocking** and will execute the DataFrame when called
 
         """
-        if write_mode not in ["append", "overwrite", "overwrite-partitions"]:
+        mode_enum = _WRITE_MODES.get(write_mode)
+        if mode_enum is None:
             raise ValueError(
                 f"Only support `append`, `overwrite`, or `overwrite-partitions` mode. {write_mode} is unsupported"
             )
         if write_mode == "overwrite-partitions" and partition_cols is None:
             raise ValueError("Partition columns must be specified to use `overwrite-partitions` mode.")
 
-        io_config = get_context().daft_planning_config.default_io_config if io_config is None else io_config
+        io_config = _default_io_config() if io_config is None else io_config
 
         cols: Optional[list[Expression]] = None
         if partition_cols is not None:
             cols = self.__column_input_to_expression(tuple(partition_cols))
 
-        builder = self._builder.write_tabular(
-            root_dir=root_dir,
-            partition_cols=cols,
-            write_mode=WriteMode.from_str(write_mode),
-            file_format=FileFormat.Csv,
-            io_config=io_config,
-        )
+        # Skip execution entirely when the plan is statically known to produce no rows
+        # (e.g. `.limit(0)`) and go straight to writing an empty file. Only append mode may
+        # skip: the overwrite modes delete pre-existing files as part of execution, which
+        # must still happen even when zero rows are written.
+        if write_mode != "append" or not self._builder.is_provably_empty():
+            builder = self._builder.write_tabular(
+                root_dir=root_dir,
+                partition_cols=cols,
+                write_mode=mode_enum,
+                file_format=FileFormat.Csv,
+                io_config=io_config,
+            )
 
-        # Block and write, then retrieve data
-        write_df = DataFrame(builder)
-        write_df.collect()
-        assert write_df._result is not None
-
-        if len(write_df) > 0:
-            # Populate and return a new disconnected DataFrame
-            result_df = DataFrame(write_df._builder)
-            result_df._result_cache = write_df._result_cache
-            result_df._preview = write_df._preview
-            return result_df
-        else:
-            from daft import from_pydict
-            from daft.recordbatch.recordbatch_io import write_empty_tabular
+            # Block and write, then retrieve data
+            write_df = DataFrame(builder)
+            write_df.collect()
+            assert write_df._result is not None
 
-            file_path = write_empty_tabular(root_dir, FileFormat.Csv, self.schema(), io_config=io_config)
+            if len(write_df) > 0:
+                # Return the write result as a plain DataFrame, detached from the write plan.
+                return write_df._detach_from_result()
 
-            return from_pydict(
-                {
-                    "path": [file_path],
-                }
-            )
+        from daft.recordbatch.recordbatch_io import write_empty_tabular
+
+        file_path = write_empty_tabular(root_dir, FileFormat.Csv, self.schema(), io_config=io_config)
+
+        return _single_row_path_df(file_path)
 
     @DataframePublicAPI
     def write_json(
@@ -841,48 +999,46 @@ class DataFrame:
 
         !!! Currently only supported with the Native runner!
         """
-        if write_mode not in ["append", "overwrite", "overwrite-partitions"]:
+        mode_enum = _WRITE_MODES.get(write_mode)
+        if mode_enum is None:
             raise ValueError(
                 f"Only support `append`, `overwrite`, or `overwrite-partitions` mode. {write_mode} is unsupported"
             )
         if write_mode == "overwrite-partitions" and partition_cols is None:
             raise ValueError("Partition columns must be specified to use `overwrite-partitions` mode.")
 
-        io_config = get_context().daft_planning_config.default_io_config if io_config is None else io_config
+        io_config = _default_io_config() if io_config is None else io_config
 
         cols: Optional[list[Expression]] = None
         if partition_cols is not None:
             cols = self.__column_input_to_expression(tuple(partition_cols))
 
-        builder = self._builder.write_tabular(
-            root_dir=root_dir,
-            partition_cols=cols,
-            write_mode=WriteMode.from_str(write_mode),
-            file_format=FileFormat.Json,
-            io_config=io_config,
-        )
-        # Block and write, then retrieve data
-        write_df = DataFrame(builder)
-        write_df.collect()
-        assert write_df._result is not None
-
-        if len(write_df) > 0:
-            # Populate and return a new disconnected DataFrame
-            result_df = DataFrame(write_df._builder)
-            result_df._result_cache = write_df._result_cache
-            result_df._preview = write_df._preview
-            return result_df
-        else:
-            from daft import from_pydict
-            from daft.recordbatch.recordbatch_io import write_empty_tabular
+        # Skip execution entirely when the plan is statically known to produce no rows
+        # (e.g. `.limit(0)`) and go straight to writing an empty file. Only append mode may
+        # skip: the overwrite modes delete pre-existing files as part of execution, which
+        # must still happen even when zero rows are written.
+        if write_mode != "append" or not self._builder.is_provably_empty():
+            builder = self._builder.write_tabular(
+                root_dir=root_dir,
+                partition_cols=cols,
+                write_mode=mode_enum,
+                file_format=FileFormat.Json,
+                io_config=io_config,
+            )
+            # Block and write, then retrieve data
+            write_df = DataFrame(builder)
+            write_df.collect()
+            assert write_df._result is not None
 
-            file_path = write_empty_tabular(root_dir, FileFormat.Json, self.schema(), io_config=io_config)
+            if len(write_df) > 0:
+                # Return the write result as a plain DataFrame, detached from the write plan.
+                return write_df._detach_from_result()
 
-            return from_pydict(
-                {
-                    "path": [file_path],
-                }
-            )
+        from daft.recordbatch.recordbatch_io import write_empty_tabular
+
+        file_path = write_empty_tabular(root_dir, FileFormat.Json, self.schema(), io_config=io_config)
+
+        return _single_row_path_df(file_path)
 
     @DataframePublicAPI
     def write_iceberg(
@@ -904,77 +1060,73 @@ class DataFrame:
             This call is **blocking** and will execute the DataFrame when called
 
         """
+        # Validate the mode before paying for any third-party imports.
+        if mode not in ["append", "overwrite"]:
+            raise ValueError(f"Only support `append` or `overwrite` mode. {mode} is unsupported")
+
         import pyarrow as pa
         import pyiceberg
-        from packaging.version import parse
 
         from daft.io.iceberg._iceberg import _convert_iceberg_file_io_properties_to_io_config
 
-        if len(table.spec().fields) > 0 and parse(pyiceberg.__version__) < parse("0.7.0"):
+        pyiceberg_version = _parse_version(pyiceberg.__version__)
+
+        if len(table.spec().fields) > 0 and pyiceberg_version < _parse_version("0.7.0"):
             raise ValueError("pyiceberg>=0.7.0 is required to write to a partitioned table")
 
-        if parse(pyiceberg.__version__) < parse("0.6.0"):
+        if pyiceberg_version < _parse_version("0.6.0"):
             raise ValueError(f"Write Iceberg is only supported on pyiceberg>=0.6.0, found {pyiceberg.__version__}")
 
-        if parse(pa.__version__) < parse("12.0.1"):
+        if _parse_version(pa.__version__) < _parse_version("12.0.1"):
             raise ValueError(
                 f"Write Iceberg is only supported on pyarrow>=12.0.1, found {pa.__version__}. See this issue for more information: https://github.com/apache/arrow/issues/37054#issuecomment-1668644887"
             )
 
-        if mode not in ["append", "overwrite"]:
-            raise ValueError(f"Only support `append` or `overwrite` mode. {mode} is unsupported")
-
         io_config = (
             _convert_iceberg_file_io_properties_to_io_config(table.io.properties) if io_config is None else io_config
         )
-        io_config = get_context().daft_planning_config.default_io_config if io_config is None else io_config
-
-        operations = []
-        path = []
-        rows = []
-        size = []
+        io_config = _default_io_config() if io_config is None else io_config
 
         builder = self._builder.write_iceberg(table, io_config)
         write_df = DataFrame(builder)
         write_df.collect()
 
-        write_result = write_df.to_pydict()
-        assert "data_file" in write_result
-        data_files = write_result["data_file"]
-
-        if mode == "overwrite":
-            deleted_files = table.scan().plan_files()
-        else:
-            deleted_files = []
+        data_files = write_df._column_to_pylist("data_file")
 
         schema = table.schema()
         partitioning: dict[str, list[Any]] = {
             schema.find_field(field.source_id).name: [] for field in table.spec().fields
         }
 
-        for data_file in data_files:
-            operations.append("ADD")
-            path.append(data_file.file_path)
-            rows.append(data_file.record_count)
-            size.append(data_file.file_size_in_bytes)
-
-            for field in partitioning.keys():
-                partitioning[field].append(getattr(data_file.partition, field, None))
+        # Build the bookkeeping columns one attribute at a time rather than row-by-row.
+        operations = ["ADD"] * len(data_files)
+        path = [data_file.file_path for data_file in data_files]
+        rows = [data_file.record_count for data_file in data_files]
+        size = [data_file.file_size_in_bytes for data_file in data_files]
 
-        for pf in deleted_files:
-            data_file = pf.file
-            operations.append("DELETE")
-            path.append(data_file.file_path)
-            rows.append(data_file.record_count)
-            size.append(data_file.file_size_in_bytes)
+        # Snapshot the partition (field, column) pairs once; both the ADD pass here and the
+        # DELETE pass below append through these bindings instead of re-resolving dict entries.
+        partition_items = tuple(partitioning.items())
+        for field, values in partition_items:
+            values.extend(getattr(data_file.partition, field, None) for data_file in data_files)
 
-            for field in partitioning.keys():
-                partitioning[field].append(getattr(data_file.partition, field, None))
-
-        if parse(pyiceberg.__version__) >= parse("0.7.0"):
+        if mode == "overwrite":
+            # Stream the manifest entries straight into the bookkeeping columns rather than
+            # materializing an intermediate list of scan tasks in driver memory.
+            for pf in table.scan().plan_files():
+                data_file = pf.file
+                operations.append("DELETE")
+                path.append(data_file.file_path)
+                rows.append(data_file.record_count)
+                size.append(data_file.file_size_in_bytes)
+
+                for field, values in partition_items:
+                    values.append(getattr(data_file.partition, field, None))
+
+        if pyiceberg_version >= _parse_version("0.7.0"):
             from pyiceberg.table import ALWAYS_TRUE, TableProperties
 
-            if parse(pyiceberg.__version__) >= parse("0.8.0"):
+            if pyiceberg_version >= _parse_version("0.8.0"):
                 from pyiceberg.utils.properties import property_as_bool
 
                 property_as_bool = property_as_bool
@@ -1019,23 +1171,25 @@ class DataFrame:
 
             merge.commit()
 
-        with_operations = {
+        arrays = {
             "operation": pa.array(operations, type=pa.string()),
             "rows": pa.array(rows, type=pa.int64()),
             "file_size": pa.array(size, type=pa.int64()),
-            "file_name": pa.array([fp for fp in path], type=pa.string()),
+            "file_name": pa.array(path, type=pa.string()),
         }
 
         if partitioning:
-            with_operations["partitioning"] = pa.StructArray.from_arrays(
-                partitioning.values(), names=partitioning.keys()
-            )
+            arrays["partitioning"] = pa.StructArray.from_arrays(partitioning.values(), names=partitioning.keys())
 
-        from daft import from_pydict
+        # The arrays are already typed, so assemble the result as a record batch directly instead
+        # of going through from_pydict's per-column type inference.
+        with_operations = pa.RecordBatch.from_arrays(list(arrays.values()), names=list(arrays.keys()))
 
         # NOTE: We are losing the history of the plan here.
         # This is due to the fact that the logical plan of the write_iceberg returns datafiles but we want to return the above data
-        return from_pydict(with_operations)
+        return DataFrame._from_micropartitions(
+            MicroPartition.from_arrow_record_batches([with_operations], with_operations.schema)
+        )
 
     @DataframePublicAPI
     def write_deltalake(
@@ -1073,12 +1227,15 @@ class DataFrame:
         Note:
             This call is **blocking** and will execute the DataFrame when called
         """
+        # Validate cheap pure-Python arguments before paying for any third-party imports.
+        if schema_mode == "merge":
+            raise ValueError("Schema mode' merge' is not currently supported for write_deltalake.")
+
         import json
 
         import deltalake
         import pyarrow as pa
         from deltalake.exceptions import TableNotFoundError
-        from packaging.version import parse
 
         from daft import from_pydict
         from daft.dependencies import unity_catalog
@@ -1092,6 +1249,8 @@ class DataFrame:
         )
         from daft.io.object_store_options import io_config_to_storage_options
 
+        deltalake_version = _parse_version(deltalake.__version__)
+
         def _create_metadata_param(metadata: Optional[dict[str, str]]) -> Any:
             """From deltalake>=0.20.0 onwards, custom_metadata has to be passed as CommitProperties.
 
@@ -1101,20 +1260,17 @@ class DataFrame:
             Returns:
                 DataFrame: metadata for deltalake<0.20.0, otherwise CommitProperties with custom_metadata
             """
-            if parse(deltalake.__version__) < parse("0.20.0"):
+            if deltalake_version < _parse_version("0.20.0"):
                 return metadata
             else:
                 from deltalake import CommitProperties
 
                 return CommitProperties(custom_metadata=metadata)
 
-        if schema_mode == "merge":
-            raise ValueError("Schema mode' merge' is not currently supported for write_deltalake.")
-
-        if parse(deltalake.__version__) < parse("0.14.0"):
+        if deltalake_version < _parse_version("0.14.0"):
             raise ValueError(f"Write delta lake is only supported on deltalake>=0.14.0, found {deltalake.__version__}")
 
-        io_config = get_context().daft_planning_config.default_io_config if io_config is None else io_config
+        io_config = _default_io_config() if io_config is None else io_config
 
         # Retrieve table_uri and storage_options from various backends
         table_uri: str
@@ -1126,10 +1282,10 @@ class DataFrame:
             new_storage_options = io_config_to_storage_options(io_config, table_uri)
             storage_options.update(new_storage_options or {})
         else:
-            if isinstance(table, str):
-                table_uri = os.path.expanduser(table)
-            elif isinstance(table, pathlib.Path):
-                table_uri = str(table)
+            if isinstance(table, (str, pathlib.Path)):
+                # Collapse the two path-like cases into a single check via os.fspath; expanduser
+                # is a no-op for paths that don't start with "~".
+                table_uri = os.path.expanduser(os.fspath(table))
             elif unity_catalog.module_available() and isinstance(table, unity_catalog.UnityCatalogTable):
                 table_uri = table.table_uri
                 io_config = table.io_config
@@ -1149,6 +1305,25 @@ class DataFrame:
             except TableNotFoundError:
                 table = None
 
+        # No-op fast path: if the table already exists and the caller asked to ignore it, return
+        # the empty result before doing any locking-provider setup, schema conversion, or schema
+        # comparison work. The cheap partition-column check still runs first so a mismatched
+        # request errors rather than silently returning the empty result.
+        if table is not None and mode == "ignore":
+            table_partition_columns = table.metadata().partition_columns
+            if partition_cols and partition_cols != table_partition_columns:
+                raise ValueError(
+                    f"Expected partition columns to match that of the existing table ({table_partition_columns}), but received: {partition_cols}"
+                )
+            return from_pydict(
+                {
+                    "operation": pa.array([], type=pa.string()),
+                    "rows": pa.array([], type=pa.int64()),
+                    "file_size": pa.array([], type=pa.int64()),
+                    "file_name": pa.array([], type=pa.string()),
+                }
+            )
+
         # see: https://delta-io.github.io/delta-rs/usage/writing/writing-to-s3-with-locking-provider/
         scheme = get_protocol_from_path(table_uri)
         if scheme == "s3" or scheme == "s3a":
@@ -1164,18 +1339,20 @@ class DataFrame:
             if allow_unsafe_rename:
                 storage_options["MOUNT_ALLOW_UNSAFE_RENAME"] = "true"
 
-        pyarrow_schema = pa.schema((f.name, f.dtype.to_arrow_dtype()) for f in self.schema())
+        schema = self.schema()
+        pyarrow_schema = pa.schema((f.name, f.dtype.to_arrow_dtype()) for f in schema)
 
         large_dtypes = True
         delta_schema = convert_pa_schema_to_delta(pyarrow_schema, large_dtypes=large_dtypes)
 
         if table:
-            if partition_cols and partition_cols != table.metadata().partition_columns:
+            table_partition_columns = table.metadata().partition_columns
+            if partition_cols and partition_cols != table_partition_columns:
                 raise ValueError(
-                    f"Expected partition columns to match that of the existing table ({table.metadata().partition_columns}), but received: {partition_cols}"
+                    f"Expected partition columns to match that of the existing table ({table_partition_columns}), but received: {partition_cols}"
                 )
             else:
-                partition_cols = table.metadata().partition_columns
+                partition_cols = table_partition_columns
 
             table.update_incremental()
 
@@ -1189,22 +1366,13 @@ class DataFrame:
                 )
             if mode == "error":
                 raise AssertionError("Delta table already exists, write mode set to error.")
-            elif mode == "ignore":
-                return from_pydict(
-                    {
-                        "operation": pa.array([], type=pa.string()),
-                        "rows": pa.array([], type=pa.int64()),
-                        "file_size": pa.array([], type=pa.int64()),
-                        "file_name": pa.array([], type=pa.string()),
-                    }
-                )
             version = table.version() + 1
         else:
             version = 0
 
         if partition_cols is not None:
             for c in partition_cols:
-                if self.schema()[c].dtype == DataType.binary():
+                if schema[c].dtype == DataType.binary():
                     raise NotImplementedError("Binary partition columns are not yet supported for Delta Lake writes")
 
         builder = self._builder.write_deltalake(
@@ -1218,21 +1386,19 @@ class DataFrame:
         write_df = DataFrame(builder)
         write_df.collect()
 
-        write_result = write_df.to_pydict()
-        assert "add_action" in write_result
-        add_actions: list[AddAction] = write_result["add_action"]
-
-        operations = []
-        paths = []
-        rows = []
-        sizes = []
-
-        for add_action in add_actions:
-            stats = json.loads(add_action.stats)
-            operations.append("ADD")
-            paths.append(add_action.path)
-            rows.append(stats["numRecords"])
-            sizes.append(add_action.size)
+        add_actions: list[AddAction] = write_df._column_to_pylist("add_action")
+
+        operations = ["ADD"] * len(add_actions)
+        paths = [add_action.path for add_action in add_actions]
+        sizes = [add_action.size for add_action in add_actions]
+        # Prefer the typed record count stashed by make_deltalake_add_action; fall back to
+        # parsing the stats JSON for actions that lost the attribute (e.g. older deltalake).
+        rows = [
+            num_records
+            if (num_records := getattr(add_action, "num_records", None)) is not None
+            else json.loads(add_action.stats)["numRecords"]
+            for add_action in add_actions
+        ]
 
         if table is None:
             create_table_with_add_actions(
@@ -1249,16 +1415,16 @@ class DataFrame:
             )
         else:
             if mode == "overwrite":
+                # Pull only the columns we need out of the add actions and extend the
+                # bookkeeping lists in bulk instead of indexing row-by-row in Python.
                 old_actions = pa.record_batch(table.get_add_actions())
-                old_actions_dict = old_actions.to_pydict()
-                for i in range(old_actions.num_rows):
-                    operations.append("DELETE")
-                    paths.append(old_actions_dict["path"][i])
-                    rows.append(old_actions_dict["num_records"][i])
-                    sizes.append(old_actions_dict["size_bytes"][i])
+                operations.extend(["DELETE"] * old_actions.num_rows)
+                paths.extend(old_actions.column("path").to_pylist())
+                rows.extend(old_actions.column("num_records").to_pylist())
+                sizes.extend(old_actions.column("size_bytes").to_pylist())
 
             metadata_param = _create_metadata_param(custom_metadata)
-            if parse(deltalake.__version__) < parse("1.0.0"):
+            if deltalake_version < _parse_version("1.0.0"):
                 table._table.create_write_transaction(
                     add_actions, mode, partition_cols or [], delta_schema, None, metadata_param
                 )
@@ -1273,16 +1439,24 @@ class DataFrame:
                 )
             table.update_incremental()
 
-        with_operations = from_pydict(
-            {
-                "operation": pa.array(operations, type=pa.string()),
-                "rows": pa.array(rows, type=pa.int64()),
-                "file_size": pa.array(sizes, type=pa.int64()),
-                "file_name": pa.array([os.path.basename(fp) for fp in paths], type=pa.string()),
-            }
+        import pyarrow.compute as pc
+
+        # As in write_iceberg, the arrays are already typed, so build the record batch directly.
+        # Basenames are computed with a vectorized regex kernel: strip everything up to and
+        # including the last "/".
+        with_operations = pa.RecordBatch.from_arrays(
+            [
+                pa.array(operations, type=pa.string()),
+                pa.array(rows, type=pa.int64()),
+                pa.array(sizes, type=pa.int64()),
+                pc.replace_substring_regex(pa.array(paths, type=pa.string()), r"^.*/", ""),
+            ],
+            names=["operation", "rows", "file_size", "file_name"],
         )
 
-        return with_operations
+        return DataFrame._from_micropartitions(
+            MicroPartition.from_arrow_record_batches([with_operations], with_operations.schema)
+        )
 
     @DataframePublicAPI
     def write_sink(self, sink: "DataSink[WriteResultType]") -> "DataFrame":
@@ -1303,9 +1477,7 @@ class DataFrame:
         write_df = DataFrame(builder)
         write_df.collect()
 
-        results = write_df.to_pydict()
-        assert "write_results" in results
-        micropartition = sink.finalize(results["write_results"])
+        micropartition = sink.finalize(write_df._column_to_pylist("write_results"))
         if micropartition.schema() != sink.schema():
             raise ValueError(
                 f"Schema mismatch between the data sink's schema and the result's schema:\nSink schema:\n{sink.schema()}\nResult schema:\n{micropartition.schema()}"
@@ -1315,6 +1487,26 @@ class DataFrame:
         # for all other sinks too.
         return DataFrame._from_micropartitions(micropartition)
 
+    @DataframePublicAPI
+    def write_many(self, sinks: list["DataSink[Any]"]) -> list["DataFrame"]:
+        """Writes the DataFrame to multiple DataSinks, executing the upstream plan only once.
+
+        The DataFrame is materialized a single time and each sink consumes the materialized
+        partitions, instead of re-executing the source plan once per sink.
+
+        Args:
+            sinks: The DataSinks to write to.
+
+        Returns:
+            list[DataFrame]: One result dataframe per sink, in the same order, each built from
+                the micropartition returned by that sink's `.finalize()` method.
+
+        Note:
+            This call is **blocking** and will execute the DataFrame when called
+        """
+        self.collect()
+        return [self.write_sink(sink) for sink in sinks]
+
     @DataframePublicAPI
     def write_lance(
         self,
@@ -1440,12 +1632,11 @@ class DataFrame:
 
     def __column_input_to_expression(self, columns: Iterable[ColumnInputType]) -> list[Expression]:
         # TODO(Kevin): remove this method and use _column_inputs_to_expressions
-        return [col(c) if isinstance(c, str) else c for c in columns]
+        return list(map(_column_input_to_expression, columns))
 
     def _wildcard_inputs_to_expressions(self, columns: tuple[ManyColumnsInputType, ...]) -> list[Expression]:
         """Handles wildcard argument column inputs."""
-        column_input: Iterable[ColumnInputType] = columns[0] if len(columns) == 1 else columns  # type: ignore
-        return column_inputs_to_expressions(column_input)
+        return column_inputs_to_expressions(*columns)
 
     if TYPE_CHECKING:
 
@@ -1460,42 +1651,45 @@ class DataFrame:
 
     def __getitem__(self, item: Union[int, str, slice, Iterable[Union[str, int]]]) -> Union[Expression, "DataFrame"]:
         """Gets a column from the DataFrame as an Expression (``df["mycol"]``)."""
-        result: Optional[Expression]
-
-        if isinstance(item, int):
-            schema = self._builder.schema()
-            if item < -len(schema) or item >= len(schema):
-                raise ValueError(f"{item} out of bounds for {schema}")
-            result = ExpressionsProjection.from_schema(schema)[item]
-            assert result is not None
-            return result
-        elif isinstance(item, str):
-            schema = self._builder.schema()
+        # Branches are ordered by dispatch frequency, with the cheap concrete-type checks
+        # ahead of the ABC-protocol Iterable check (which walks the MRO and subclass hooks).
+        if isinstance(item, str):
+            schema = self.schema()
             if item not in schema.column_names() and item != "*":
                 raise ValueError(f"{item} does not exist in schema {schema}")
 
             return col(item)
-        elif isinstance(item, Iterable):
-            schema = self._builder.schema()
+        elif isinstance(item, int):
+            schema = self.schema()
+            names = schema.column_names()
+            if item < -len(names) or item >= len(names):
+                raise ValueError(f"{item} out of bounds for {schema}")
+            return col(names[item])
+        elif isinstance(item, slice):
+            schema = self.schema()
+            names = schema.column_names()
+            # The sliced names come straight from the schema, so feed them to the builder
+            # directly rather than routing through select()'s input re-normalization.
+            builder = self._builder.select([col(n) for n in names[item]])
+            return DataFrame(builder)
+        elif isinstance(item, (list, tuple)) or isinstance(item, Iterable):
+            schema = self.schema()
+            names = schema.column_names()
+            name_set = set(names)
 
             columns = []
             for it in item:
                 if isinstance(it, str):
-                    result = col(schema[it].name)
-                    columns.append(result)
+                    if it not in name_set:
+                        raise ValueError(f"{it} was not found in Schema of fields {names}")
+                    columns.append(col(it))
                 elif isinstance(it, int):
-                    if it < -len(schema) or it >= len(schema):
+                    if it < -len(names) or it >= len(names):
                         raise ValueError(f"{it} out of bounds for {schema}")
-                    field = list(self._builder.schema())[it]
-                    columns.append(col(field.name))
+                    columns.append(col(names[it]))
                 else:
                     raise ValueError(f"unknown indexing type: {type(it)}")
             return self.select(*columns)
-        elif isinstance(item, slice):
-            schema = self._builder.schema()
-            columns_exprs: ExpressionsProjection = ExpressionsProjection.from_schema(schema)
-            selected_columns = columns_exprs[item]
-            return self.select(*selected_columns)
         else:
             raise ValueError(f"unknown indexing type: {type(item)}")
 
@@ -1788,7 +1982,9 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 3 of 3 rows)
         """
-        builder = self._builder.exclude(list(names))
+        if not names:
+            return self
+        builder = self._builder.exclude(names)
         return DataFrame(builder)
 
     @DataframePublicAPI
@@ -1854,9 +2050,7 @@ class DataFrame:
             (Showing first 1 of 1 rows)
         """
         if isinstance(predicate, str):
-            from daft.sql.sql import sql_expr
-
-            predicate = sql_expr(predicate)
+            predicate = _cached_sql_expr(predicate)
         builder = self._builder.filter(predicate)
         return DataFrame(builder)
 
@@ -1894,7 +2088,10 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 3 of 3 rows)
         """
-        return self.with_columns({column_name: expr})
+        if expr.name() != column_name:
+            expr = expr.alias(column_name)
+        builder = self._builder.with_columns([expr])
+        return DataFrame(builder)
 
     @DataframePublicAPI
     def with_columns(
@@ -1928,9 +2125,11 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 3 of 3 rows)
         """
-        new_columns = [col.alias(name) for name, col in columns.items()]
-
-        builder = self._builder.with_columns(new_columns)
+        if not columns:
+            return self
+        # Target names are applied Rust-side in one call rather than via a per-column
+        # alias() round-trip; names already carried by their expression are left as-is.
+        builder = self._builder.with_columns_named(columns)
         return DataFrame(builder)
 
     @DataframePublicAPI
@@ -1964,6 +2163,8 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 3 of 3 rows)
         """
+        if existing not in self.schema().to_name_set():
+            return self
         builder = self._builder.with_column_renamed(existing, new)
         return DataFrame(builder)
 
@@ -1997,6 +2198,11 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 3 of 3 rows)
         """
+        if not cols_map:
+            return self
+        name_set = self.schema().to_name_set()
+        if not any(existing in name_set for existing in cols_map):
+            return self
         builder = self._builder.with_columns_renamed(cols_map)
         return DataFrame(builder)
 
@@ -2084,16 +2290,22 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 5 of 5 rows)
         """
-        if not isinstance(by, list):
-            by = [
-                by,
-            ]
+        # Fast path for the overwhelmingly common single-column ascending sort with default
+        # null placement: build the plan node directly with constant flags, skipping the
+        # expression-list normalization and flag broadcasting below.
+        if isinstance(by, str) and desc is False and nulls_first is None:
+            return DataFrame(self._builder.sort_single_asc(by))
+
+        if isinstance(by, str):
+            sort_by = [col(by)]
+        elif isinstance(by, Expression):
+            sort_by = [by]
+        else:
+            sort_by = self.__column_input_to_expression(by)
 
         if nulls_first is None:
             nulls_first = desc
 
-        sort_by = self.__column_input_to_expression(by)
-
         builder = self._builder.sort(sort_by=sort_by, descending=desc, nulls_first=nulls_first)
         return DataFrame(builder)
 
@@ -2160,8 +2372,16 @@ class DataFrame:
         Returns:
             int: count of the number of rows in this DataFrame.
         """
-        if self._result is not None:
-            return len(self._result)
+        # A materialized result already knows its row count from partition metadata.
+        if self._result_cache is not None:
+            num_rows = self._result_cache.num_rows()
+            if num_rows is not None:
+                return num_rows
+        # A bare source with exact metadata (e.g. an uncollected in-memory scan) can answer
+        # from stats without launching an execution.
+        num_rows = self._builder.num_rows_from_stats()
+        if num_rows is not None:
+            return num_rows
         builder = self._builder.count()
         count_df = DataFrame(builder)
         # Expects builder to produce a single-partition, single-row DataFrame containing
@@ -2195,15 +2415,24 @@ class DataFrame:
             3
 
         """
+        builder = self._builder
+        if num is not None and self._result_cache is not None:
+            # When shrinking a materialized result (partition count known from cache
+            # metadata), coalesce adjacent partitions down to the target first so the
+            # shuffle moves `num` partitions' worth of intermediate data rather than the
+            # original, larger partition count.
+            current_num_partitions = self._result_cache.num_partitions()
+            if current_num_partitions is not None and num < current_num_partitions:
+                builder = builder.into_partitions(num)
         if len(partition_by) == 0:
             warnings.warn(
                 "No columns specified for repartition, so doing a random shuffle. If you do not require rebalancing of "
                 "partitions, you may instead prefer using `df.into_partitions(N)` which is a cheaper operation that "
                 "avoids shuffling data."
             )
-            builder = self._builder.random_shuffle(num)
+            builder = builder.random_shuffle(num)
         else:
-            builder = self._builder.hash_repartition(num, self.__column_input_to_expression(partition_by))
+            builder = builder.hash_repartition(num, self.__column_input_to_expression(partition_by))
         return DataFrame(builder)
 
     @DataframePublicAPI
@@ -2229,6 +2458,48 @@ class DataFrame:
         builder = self._builder.into_partitions(num)
         return DataFrame(builder)
 
+    def _salted_join(
+        self,
+        other: "DataFrame",
+        on: Optional[Union[list[ColumnInputType], ColumnInputType]],
+        strategy: Optional[Literal["hash", "sort_merge", "broadcast"]],
+        prefix: Optional[str],
+        suffix: Optional[str],
+        skew_hints: dict[str, list[Any]],
+    ) -> Optional["DataFrame"]:
+        """Inner join with heavy-hitter salting, or None when the join shape does not support it.
+
+        Left-side rows with hinted key values get a salt in ``[0, N)`` derived from a row id
+        (0 otherwise); the matching right-side rows are replicated once per salt bucket while
+        the rest get salt 0. Joining on the original keys plus the salt then spreads each hot
+        key over N partitions instead of stalling one. Rows with null keys never match an
+        inner join, so filtering them from the replicated side is semantics-preserving.
+        """
+        if on is None:
+            return None
+        key_names = [on] if isinstance(on, str) else list(on)
+        if not all(isinstance(k, str) for k in key_names):
+            return None
+        if not all(k in key_names for k in skew_hints):
+            return None
+        salt = "__daft_join_salt"
+        row_id = "__daft_join_salt_row_id"
+        taken = set(self.column_names) | set(other.column_names)
+        if salt in taken or row_id in taken:
+            return None
+
+        n = _SKEWED_JOIN_REPLICATION_FACTOR
+        is_heavy = reduce(lambda x, y: x | y, (col(k).is_in(values) for k, values in skew_hints.items()))
+        left = self._add_monotonically_increasing_id(row_id)
+        left_salt = is_heavy.if_else((col(row_id) % n).cast(DataType.int64()), lit(0))
+        left = left.with_column(salt, left_salt).exclude(row_id)
+        right_heavy = other.where(is_heavy).with_column(salt, list_(*[lit(i) for i in range(n)])).explode(salt)
+        right = right_heavy.concat(other.where(~is_heavy).with_column(salt, lit(0)))
+        joined = left.join(
+            right, on=[*key_names, salt], how="inner", strategy=strategy, prefix=prefix, suffix=suffix
+        )
+        return joined.exclude(salt)
+
     @DataframePublicAPI
     def join(
         self,
@@ -2240,6 +2511,7 @@ class DataFrame:
         strategy: Optional[Literal["hash", "sort_merge", "broadcast"]] = None,
         prefix: Optional[str] = None,
         suffix: Optional[str] = None,
+        skew_hints: Optional[dict[str, list[Any]]] = None,
     ) -> "DataFrame":
         """Column-wise join of the current DataFrame with an ``other`` DataFrame, similar to a SQL ``JOIN``.
 
@@ -2256,6 +2528,10 @@ class DataFrame:
                 chooses the join strategy automatically during query optimization. The default is None.
             suffix (Optional[str], optional): Suffix to add to the column names in case of a name collision. Defaults to "".
             prefix (Optional[str], optional): Prefix to add to the column names in case of a name collision. Defaults to "right.".
+            skew_hints (Optional[Dict[str, List]], optional): Experimental, performance-only hint mapping join key column names to
+                their known heavy-hitter values. For inner joins keyed on shared column names (via ``on``), rows with hinted values
+                are salted across multiple partitions (replicating the matching right-side rows) so a single hot key no longer
+                stalls one partition. Ignored when the join shape does not support salting. Defaults to None.
 
         Returns:
             DataFrame: Joined DataFrame.
@@ -2323,10 +2599,20 @@ class DataFrame:
             <BLANKLINE>
             (Showing first 2 of 2 rows)
         """
+        if skew_hints and how == "inner":
+            salted = self._salted_join(other, on, strategy, prefix, suffix, skew_hints)
+            if salted is not None:
+                return salted
+
         if how == "cross":
             if any(side_on is not None for side_on in [on, left_on, right_on]):
                 raise ValueError("In a cross join, `on`, `left_on`, and `right_on` cannot be set")
 
+            if strategy is None:
+                # No key expressions to convert; go straight to the dedicated builder entry.
+                builder = self._builder.cross_join(other._builder, prefix=prefix, suffix=suffix)
+                return DataFrame(builder)
+
             left_on = []
             right_on = []
         elif on is None:
@@ -2376,9 +2662,16 @@ class DataFrame:
             [df.select()][daft.DataFrame.select] and [expr.cast()][daft.expressions.Expression.cast] methods
             to ensure schema compatibility before concatenation.
         """
-        if self.schema() != other.schema():
+        left_schema = self.schema()
+        right_schema = other.schema()
+        # Compare cached 64-bit fingerprints before the field-by-field walk: repeated concats
+        # (e.g. unioning many partitions in a loop) then pay an integer compare up front, and
+        # mismatched schemas are rejected without walking either schema.
+        if left_schema is not right_schema and (
+            left_schema.fingerprint() != right_schema.fingerprint() or left_schema != right_schema
+        ):
             raise ValueError(
-                f"DataFrames must have exactly the same schema for concatenation!\nExpected:\n{self.schema()}\n\nReceived:\n{other.schema()}"
+                f"DataFrames must have exactly the same schema for concatenation!\nExpected:\n{left_schema}\n\nReceived:\n{right_schema}"
             )
         builder = self._builder.concat(other._builder)
         return DataFrame(builder)
@@ -2432,26 +2725,27 @@ class DataFrame:
 
         """
         if len(cols) == 0:
-            columns = self.__column_input_to_expression(self.column_names)
+            # One schema call yields every float column, instead of probing the dtype of
+            # each column expression across the FFI boundary.
+            float_columns = [col(name) for name in self.schema().float_column_names()]
         else:
-            columns = self.__column_input_to_expression(cols)
-        float_columns = [
-            column
-            for column in columns
-            if (
-                column._to_field(self.schema()).dtype == DataType.float32()
-                or column._to_field(self.schema()).dtype == DataType.float64()
-            )
-        ]
+            schema = self.schema()
+            float_dtypes = (DataType.float32(), DataType.float64())
+            float_columns = [
+                column for column in self.__column_input_to_expression(cols) if column._to_field(schema).dtype in float_dtypes
+            ]
 
         # avoid superfluous .where with empty iterable when nothing to filter.
         if not float_columns:
             return self
 
+        # Each column contributes a single null-tolerant NaN mask (is_nan yields null for null
+        # entries, which must count as "not NaN"): two kernel passes per column, rather than
+        # re-wrapping every reduction step in is_null/if_else as the old expression tree did.
         return self.where(
-            ~reduce(
-                lambda x, y: x.is_null().if_else(lit(False), x) | y.is_null().if_else(lit(False), y),
-                (x.float.is_nan() for x in float_columns),
+            ~_balanced_reduce(
+                lambda x, y: x | y,
+                [x.float.is_nan().fill_null(lit(False)) for x in float_columns],
             )
         )
 
@@ -2491,7 +2785,9 @@ class DataFrame:
             columns = self.__column_input_to_expression(self.column_names)
         else:
             columns = self.__column_input_to_expression(cols)
-        return self.where(~reduce(lambda x, y: x | y, (x.is_null() for x in columns)))
+        # Keep-predicate expressed directly as a conjunction of not_null masks (De Morgan of
+        # "not any null"), saving the final negation pass over the combined mask.
+        return self.where(_balanced_reduce(lambda x, y: x & y, [x.not_null() for x in columns]))
 
     @DataframePublicAPI
     def explode(self, *columns: ColumnInputType) -> "DataFrame":
@@ -2705,7 +3001,22 @@ class DataFrame:
 
             groupby_name_set = set() if group_by is None else group_by.to_name_set()
             cols = tuple(c for c in self.column_names if c not in groupby_name_set)
-        exprs = self._wildcard_inputs_to_expressions(cols)
+        if all(type(c) is str for c in cols):
+            # Chained pipelines re-issue aggs over the same string column sets; memoize the
+            # parsed Expressions (immutable plan fragments) so repeats skip the conversion.
+            cache = self.__agg_expr_cache
+            if cache is None:
+                cache = self.__agg_expr_cache = {}
+            exprs = cache.get(cols)  # type: ignore[arg-type]
+            if exprs is None:
+                exprs = cache[cols] = self._wildcard_inputs_to_expressions(cols)  # type: ignore[index]
+        else:
+            exprs = self._wildcard_inputs_to_expressions(cols)
+        op = _AGG_ALL_OPS.get(fn)
+        if op is not None:
+            # Known op: the agg expressions are built Rust-side in one batched builder call.
+            builder = self._builder.agg_all(op, exprs, list(group_by) if group_by is not None else None)
+            return DataFrame(builder)
         return self._agg([fn(c) for c in exprs], group_by)
 
     def _map_groups(self, udf: Expression, group_by: Optional[ExpressionsProjection] = None) -> "DataFrame":
@@ -3457,8 +3768,9 @@ class DataFrame:
             int: count of rows.
 
         """
-        if self._result is not None:
-            return len(self._result)
+        result = self._result
+        if result is not None:
+            return len(result)
 
         message = (
             "Cannot call len() on an unmaterialized dataframe:"
@@ -3505,7 +3817,7 @@ class DataFrame:
         assert result is not None
 
         pd_df = result.to_pandas(
-            schema=self._builder.schema(),
+            schema=self.schema(),
             coerce_temporal_nanoseconds=coerce_temporal_nanoseconds,
         )
         return pd_df
@@ -3544,6 +3856,19 @@ class DataFrame:
         assert result is not None
         return result.to_pydict(schema=self.schema())
 
+    def _column_to_pylist(self, name: str) -> list[Any]:
+        """Collects the DataFrame and returns a single column as a Python list.
+
+        Unlike `to_pydict`, only the requested column is converted to Python objects; the write
+        methods use this to pull their metadata column out of a result without materializing the
+        rest.
+        """
+        self.collect()
+        result = self._result
+        assert result is not None
+        merged = result._get_merged_micropartition(self.schema())
+        return merged.get_column_by_name(name).to_pylist()
+
     @DataframePublicAPI
     def to_pylist(self) -> list[Any]:
         """Converts the current Dataframe into a python list.
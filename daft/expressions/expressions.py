@@ -15,14 +15,16 @@ from typing import (
     overload,
 )
 
-import daft.daft as native
 from daft import context
 from daft.daft import (
     CountMode,
     ImageFormat,
     ImageMode,
     ResourceRequest,
+    get_function_from_registry,
     initialize_udfs,
+    interval_lit,
+    list_,
     resolved_col,
     sql_datatype,
     unresolved_col,
@@ -193,7 +195,7 @@ def list_(*items: Expression | str) -> Expression:
 
     """
     assert len(items) > 0, "List constructor requires at least one item"
-    return Expression._from_pyexpr(native.list_([col(i)._expr if isinstance(i, str) else i._expr for i in items]))
+    return Expression._from_pyexpr(list_([col(i)._expr if isinstance(i, str) else i._expr for i in items]))
 
 
 def struct(*fields: Expression | str) -> Expression:
@@ -239,7 +241,7 @@ def struct(*fields: Expression | str) -> Expression:
             pyinputs.append(col(field)._expr)
         else:
             raise TypeError("expected Expression or str as input for struct()")
-    f = native.get_function_from_registry("struct")
+    f = get_function_from_registry("struct")
     return Expression._from_pyexpr(f(*pyinputs))
 
 
@@ -254,7 +256,7 @@ def interval(
     nanos: int | None = None,
 ) -> Expression:
     """Creates an Expression representing an interval."""
-    lit_value = native.interval_lit(
+    lit_value = interval_lit(
         years=years, months=months, days=days, hours=hours, minutes=minutes, seconds=seconds, millis=millis, nanos=nanos
     )
     return Expression._from_pyexpr(lit_value)
@@ -289,7 +291,7 @@ def coalesce(*args: Expression) -> Expression:
         (Showing first 3 of 3 rows)
 
     """
-    f = native.get_function_from_registry("coalesce")
+    f = get_function_from_registry("coalesce")
 
     return Expression._from_pyexpr(f(*[arg._expr for arg in args]))
 
@@ -471,7 +473,7 @@ class Expression:
 
     def abs(self) -> Expression:
         """Absolute of a numeric expression."""
-        f = native.get_function_from_registry("abs")
+        f = get_function_from_registry("abs")
         return Expression._from_pyexpr(f(self._expr))
 
     def __add__(self, other: object) -> Expression:
@@ -666,7 +668,7 @@ class Expression:
     def _eval_expressions(self, func_name: builtins.str, *args: Any, **kwargs: Any) -> Expression:
         expr_args = [Expression._to_expression(v)._expr for v in args]
         expr_kwargs = {k: Expression._to_expression(v)._expr for k, v in kwargs.items() if v is not None}
-        f = native.get_function_from_registry(func_name)
+        f = get_function_from_registry(func_name)
         return Expression._from_pyexpr(f(self._expr, *expr_args, **expr_kwargs))
 
     def alias(self, name: builtins.str) -> Expression:
@@ -797,12 +799,12 @@ class Expression:
 
     def ceil(self) -> Expression:
         """The ceiling of a numeric expression."""
-        f = native.get_function_from_registry("ceil")
+        f = get_function_from_registry("ceil")
         return Expression._from_pyexpr(f(self._expr))
 
     def floor(self) -> Expression:
         """The floor of a numeric expression."""
-        f = native.get_function_from_registry("floor")
+        f = get_function_from_registry("floor")
         return Expression._from_pyexpr(f(self._expr))
 
     def clip(self, min: Expression | None = None, max: Expression | None = None) -> Expression:
@@ -815,27 +817,27 @@ class Expression:
         """
         min_expr = Expression._to_expression(min)._expr
         max_expr = Expression._to_expression(max)._expr
-        f = native.get_function_from_registry("clip")
+        f = get_function_from_registry("clip")
         return Expression._from_pyexpr(f(self._expr, min_expr, max_expr))
 
     def sign(self) -> Expression:
         """The sign of a numeric expression."""
-        f = native.get_function_from_registry("sign")
+        f = get_function_from_registry("sign")
         return Expression._from_pyexpr(f(self._expr))
 
     def signum(self) -> Expression:
         """The signum of a numeric expression."""
-        f = native.get_function_from_registry("sign")
+        f = get_function_from_registry("sign")
         return Expression._from_pyexpr(f(self._expr))
 
     def negate(self) -> Expression:
         """The negative of a numeric expression."""
-        f = native.get_function_from_registry("negative")
+        f = get_function_from_registry("negative")
         return Expression._from_pyexpr(f(self._expr))
 
     def negative(self) -> Expression:
         """The negative of a numeric expression."""
-        f = native.get_function_from_registry("negative")
+        f = get_function_from_registry("negative")
         return Expression._from_pyexpr(f(self._expr))
 
     def round(self, decimals: int | Expression = 0) -> Expression:
@@ -845,78 +847,78 @@ class Expression:
             decimals: number of decimal places to round to. Defaults to 0.
         """
         assert isinstance(decimals, int)
-        f = native.get_function_from_registry("round")
+        f = get_function_from_registry("round")
         decimals_expr = Expression._to_expression(decimals)._expr
         return Expression._from_pyexpr(f(self._expr, decimals=decimals_expr))
 
     def sqrt(self) -> Expression:
         """The square root of a numeric expression."""
-        f = native.get_function_from_registry("sqrt")
+        f = get_function_from_registry("sqrt")
         return Expression._from_pyexpr(f(self._expr))
 
     def cbrt(self) -> Expression:
         """The cube root of a numeric expression."""
-        f = native.get_function_from_registry("cbrt")
+        f = get_function_from_registry("cbrt")
         return Expression._from_pyexpr(f(self._expr))
 
     def sin(self) -> Expression:
         """The elementwise sine of a numeric expression."""
-        f = native.get_function_from_registry("sin")
+        f = get_function_from_registry("sin")
         return Expression._from_pyexpr(f(self._expr))
 
     def cos(self) -> Expression:
         """The elementwise cosine of a numeric expression."""
-        f = native.get_function_from_registry("cos")
+        f = get_function_from_registry("cos")
         return Expression._from_pyexpr(f(self._expr))
 
     def tan(self) -> Expression:
         """The elementwise tangent of a numeric expression."""
-        f = native.get_function_from_registry("tan")
+        f = get_function_from_registry("tan")
         return Expression._from_pyexpr(f(self._expr))
 
     def csc(self) -> Expression:
         """The elementwise cosecant of a numeric expression."""
-        f = native.get_function_from_registry("csc")
+        f = get_function_from_registry("csc")
         return Expression._from_pyexpr(f(self._expr))
 
     def sec(self) -> Expression:
         """The elementwise secant of a numeric expression."""
-        f = native.get_function_from_registry("sec")
+        f = get_function_from_registry("sec")
         return Expression._from_pyexpr(f(self._expr))
 
     def cot(self) -> Expression:
         """The elementwise cotangent of a numeric expression."""
-        f = native.get_function_from_registry("cot")
+        f = get_function_from_registry("cot")
         return Expression._from_pyexpr(f(self._expr))
 
     def sinh(self) -> Expression:
         """The elementwise hyperbolic sine of a numeric expression."""
-        f = native.get_function_from_registry("sinh")
+        f = get_function_from_registry("sinh")
         return Expression._from_pyexpr(f(self._expr))
 
     def cosh(self) -> Expression:
         """The elementwise hyperbolic cosine of a numeric expression."""
-        f = native.get_function_from_registry("cosh")
+        f = get_function_from_registry("cosh")
         return Expression._from_pyexpr(f(self._expr))
 
     def tanh(self) -> Expression:
         """The elementwise hyperbolic tangent of a numeric expression."""
-        f = native.get_function_from_registry("tanh")
+        f = get_function_from_registry("tanh")
         return Expression._from_pyexpr(f(self._expr))
 
     def arcsin(self) -> Expression:
         """The elementwise arc sine of a numeric expression."""
-        f = native.get_function_from_registry("arcsin")
+        f = get_function_from_registry("arcsin")
         return Expression._from_pyexpr(f(self._expr))
 
     def arccos(self) -> Expression:
         """The elementwise arc cosine of a numeric expression."""
-        f = native.get_function_from_registry("arccos")
+        f = get_function_from_registry("arccos")
         return Expression._from_pyexpr(f(self._expr))
 
     def arctan(self) -> Expression:
         """The elementwise arc tangent of a numeric expression."""
-        f = native.get_function_from_registry("arctan")
+        f = get_function_from_registry("arctan")
         return Expression._from_pyexpr(f(self._expr))
 
     def arctan2(self, other: Expression) -> Expression:
@@ -928,42 +930,42 @@ class Expression:
         * ``y < 0``: ``(-pi, -pi/2)``
         """
         expr = Expression._to_expression(other)
-        f = native.get_function_from_registry("arctan2")
+        f = get_function_from_registry("arctan2")
         return Expression._from_pyexpr(f(self._expr, expr._expr))
 
     def arctanh(self) -> Expression:
         """The elementwise inverse hyperbolic tangent of a numeric expression."""
-        f = native.get_function_from_registry("arctanh")
+        f = get_function_from_registry("arctanh")
         return Expression._from_pyexpr(f(self._expr))
 
     def arccosh(self) -> Expression:
         """The elementwise inverse hyperbolic cosine of a numeric expression."""
-        f = native.get_function_from_registry("arccosh")
+        f = get_function_from_registry("arccosh")
         return Expression._from_pyexpr(f(self._expr))
 
     def arcsinh(self) -> Expression:
         """The elementwise inverse hyperbolic sine of a numeric expression."""
-        f = native.get_function_from_registry("arcsinh")
+        f = get_function_from_registry("arcsinh")
         return Expression._from_pyexpr(f(self._expr))
 
     def radians(self) -> Expression:
         """The elementwise radians of a numeric expression."""
-        f = native.get_function_from_registry("radians")
+        f = get_function_from_registry("radians")
         return Expression._from_pyexpr(f(self._expr))
 
     def degrees(self) -> Expression:
         """The elementwise degrees of a numeric expression."""
-        f = native.get_function_from_registry("degrees")
+        f = get_function_from_registry("degrees")
         return Expression._from_pyexpr(f(self._expr))
 
     def log2(self) -> Expression:
         """The elementwise log base 2 of a numeric expression."""
-        f = native.get_function_from_registry("log2")
+        f = get_function_from_registry("log2")
         return Expression._from_pyexpr(f(self._expr))
 
     def log10(self) -> Expression:
         """The elementwise log base 10 of a numeric expression."""
-        f = native.get_function_from_registry("log10")
+        f = get_function_from_registry("log10")
         return Expression._from_pyexpr(f(self._expr))
 
     def log(self, base: float = math.e) -> Expression:  # type: ignore
@@ -974,28 +976,28 @@ class Expression:
         """
         assert isinstance(base, (int, float)), f"base must be an int or float, but {type(base)} was provided."
         base = lit(base)
-        f = native.get_function_from_registry("log")
+        f = get_function_from_registry("log")
         expr = f(self._expr, base._expr)
         return Expression._from_pyexpr(expr)
 
     def ln(self) -> Expression:
         """The elementwise natural log of a numeric expression."""
-        f = native.get_function_from_registry("ln")
+        f = get_function_from_registry("ln")
         return Expression._from_pyexpr(f(self._expr))
 
     def log1p(self) -> Expression:
         """The ln(self + 1) of a numeric expression."""
-        f = native.get_function_from_registry("log1p")
+        f = get_function_from_registry("log1p")
         return Expression._from_pyexpr(f(self._expr))
 
     def exp(self) -> Expression:
         """The e^self of a numeric expression."""
-        f = native.get_function_from_registry("exp")
+        f = get_function_from_registry("exp")
         return Expression._from_pyexpr(f(self._expr))
 
     def expm1(self) -> Expression:
         """The e^self - 1 of a numeric expression."""
-        f = native.get_function_from_registry("expm1")
+        f = get_function_from_registry("expm1")
         return Expression._from_pyexpr(f(self._expr))
 
     def bitwise_and(self, other: Expression) -> Expression:
@@ -1296,7 +1298,7 @@ class Expression:
         return Expression._from_pyexpr(expr)
 
     def _explode(self) -> Expression:
-        f = native.get_function_from_registry("explode")
+        f = get_function_from_registry("explode")
         return Expression._from_pyexpr(f(self._expr))
 
     def if_else(self, if_true: Expression, if_false: Expression) -> Expression:
@@ -1962,7 +1964,7 @@ class Expression:
             Invalid URLs will result in null values for all components.
             The parsed result is automatically aliased to 'urls' to enable easy struct field expansion.
         """
-        f = native.get_function_from_registry("url_parse")
+        f = get_function_from_registry("url_parse")
         return Expression._from_pyexpr(f(self._expr))
 
     def explode(self) -> Expression:
@@ -2038,7 +2040,7 @@ class Expression:
             >>> #             .alias("split_on_a")
             >>> # ).show()
         """
-        f = native.get_function_from_registry("explode")
+        f = get_function_from_registry("explode")
         return Expression._from_pyexpr(f(self._expr))
 
 
@@ -2142,7 +2144,7 @@ class ExpressionUrlNamespace(ExpressionNamespace):
         multi_thread_expr = Expression._to_expression(multi_thread)._expr
         io_config_expr = Expression._to_expression(io_config)._expr
 
-        f = native.get_function_from_registry("url_download")
+        f = get_function_from_registry("url_download")
 
         return Expression._from_pyexpr(
             f(
@@ -2196,7 +2198,7 @@ class ExpressionUrlNamespace(ExpressionNamespace):
         multi_thread_expr = Expression._to_expression(multi_thread)._expr
         io_config_expr = Expression._to_expression(io_config)._expr
         is_single_folder_expr = Expression._to_expression(is_single_folder)._expr
-        f = native.get_function_from_registry("url_upload")
+        f = get_function_from_registry("url_upload")
         return Expression._from_pyexpr(
             f(
                 self._expr,
@@ -2242,7 +2244,7 @@ class ExpressionFloatNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("is_nan")
+        f = get_function_from_registry("is_nan")
         return Expression._from_pyexpr(f(self._expr))
 
     def is_inf(self) -> Expression:
@@ -2276,7 +2278,7 @@ class ExpressionFloatNamespace(ExpressionNamespace):
             (Showing first 4 of 4 rows)
 
         """
-        f = native.get_function_from_registry("is_inf")
+        f = get_function_from_registry("is_inf")
         return Expression._from_pyexpr(f(self._expr))
 
     def not_nan(self) -> Expression:
@@ -2308,7 +2310,7 @@ class ExpressionFloatNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("not_nan")
+        f = get_function_from_registry("not_nan")
         return Expression._from_pyexpr(f(self._expr))
 
     def fill_nan(self, fill_value: Expression) -> Expression:
@@ -2338,7 +2340,7 @@ class ExpressionFloatNamespace(ExpressionNamespace):
 
         """
         fill_value = Expression._to_expression(fill_value)
-        f = native.get_function_from_registry("fill_nan")
+        f = get_function_from_registry("fill_nan")
         return Expression._from_pyexpr(f(self._expr, fill_value._expr))
 
 
@@ -3418,7 +3420,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         substr_expr = Expression._to_expression(substr)._expr
-        f = native.get_function_from_registry("utf8_contains")
+        f = get_function_from_registry("utf8_contains")
         return Expression._from_pyexpr(f(self._expr, substr_expr))
 
     def match(self, pattern: str | Expression) -> Expression:
@@ -3450,7 +3452,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         pattern_expr = Expression._to_expression(pattern)
-        f = native.get_function_from_registry("regexp_match")
+        f = get_function_from_registry("regexp_match")
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr))
 
     def endswith(self, suffix: str | Expression) -> Expression:
@@ -3482,7 +3484,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         suffix_expr = Expression._to_expression(suffix)._expr
-        f = native.get_function_from_registry("ends_with")
+        f = get_function_from_registry("ends_with")
 
         return Expression._from_pyexpr(f(self._expr, suffix_expr))
 
@@ -3515,7 +3517,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         prefix_expr = Expression._to_expression(prefix)._expr
-        f = native.get_function_from_registry("starts_with")
+        f = get_function_from_registry("starts_with")
 
         return Expression._from_pyexpr(f(self._expr, prefix_expr))
 
@@ -3570,7 +3572,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         pattern_expr = Expression._to_expression(pattern)
         f_name = "regexp_split" if regex else "split"
-        f = native.get_function_from_registry(f_name)
+        f = get_function_from_registry(f_name)
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr))
 
     def concat(self, other: str | Expression) -> Expression:
@@ -3665,7 +3667,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         pattern_expr = Expression._to_expression(pattern)
         idx = Expression._to_expression(index)
-        f = native.get_function_from_registry("regexp_extract")
+        f = get_function_from_registry("regexp_extract")
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr, idx._expr))
 
     def extract_all(self, pattern: str | Expression, index: int = 0) -> Expression:
@@ -3723,7 +3725,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         pattern_expr = Expression._to_expression(pattern)
         idx = Expression._to_expression(index)
-        f = native.get_function_from_registry("regexp_extract_all")
+        f = get_function_from_registry("regexp_extract_all")
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr, idx._expr))
 
     def replace(
@@ -3786,7 +3788,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             f_name = "regexp_replace"
         else:
             f_name = "replace"
-        f = native.get_function_from_registry(f_name)
+        f = get_function_from_registry(f_name)
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr, replacement_expr._expr))
 
     def length(self) -> Expression:
@@ -3815,7 +3817,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("length")
+        f = get_function_from_registry("length")
         return Expression._from_pyexpr(f(self._expr))
 
     def length_bytes(self) -> Expression:
@@ -3844,7 +3846,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("length_bytes")
+        f = get_function_from_registry("length_bytes")
         return Expression._from_pyexpr(f(self._expr))
 
     def lower(self) -> Expression:
@@ -3873,7 +3875,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("lower")
+        f = get_function_from_registry("lower")
         return Expression._from_pyexpr(f(self._expr))
 
     def upper(self) -> Expression:
@@ -3902,7 +3904,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("upper")
+        f = get_function_from_registry("upper")
         return Expression._from_pyexpr(f(self._expr))
 
     def lstrip(self) -> Expression:
@@ -3931,7 +3933,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("lstrip")
+        f = get_function_from_registry("lstrip")
         return Expression._from_pyexpr(f(self._expr))
 
     def rstrip(self) -> Expression:
@@ -3960,7 +3962,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("rstrip")
+        f = get_function_from_registry("rstrip")
         return Expression._from_pyexpr(f(self._expr))
 
     def reverse(self) -> Expression:
@@ -3989,7 +3991,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("reverse")
+        f = get_function_from_registry("reverse")
         return Expression._from_pyexpr(f(self._expr))
 
     def capitalize(self) -> Expression:
@@ -4018,7 +4020,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
             (Showing first 3 of 3 rows)
 
         """
-        f = native.get_function_from_registry("capitalize")
+        f = get_function_from_registry("capitalize")
         return Expression._from_pyexpr(f(self._expr))
 
     def left(self, nchars: int | Expression) -> Expression:
@@ -4048,7 +4050,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         nchars_expr = Expression._to_expression(nchars)
-        f = native.get_function_from_registry("left")
+        f = get_function_from_registry("left")
         return Expression._from_pyexpr(f(self._expr, nchars_expr._expr))
 
     def right(self, nchars: int | Expression) -> Expression:
@@ -4078,7 +4080,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         nchars_expr = Expression._to_expression(nchars)
-        f = native.get_function_from_registry("right")
+        f = get_function_from_registry("right")
         return Expression._from_pyexpr(f(self._expr, nchars_expr._expr))
 
     def find(self, substr: str | Expression) -> Expression:
@@ -4111,7 +4113,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         substr_expr = Expression._to_expression(substr)
-        f = native.get_function_from_registry("find")
+        f = get_function_from_registry("find")
         return Expression._from_pyexpr(f(self._expr, substr_expr._expr))
 
     def rpad(self, length: int | Expression, pad: str | Expression) -> Expression:
@@ -4146,7 +4148,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         length_expr = Expression._to_expression(length)
         pad_expr = Expression._to_expression(pad)
-        f = native.get_function_from_registry("rpad")
+        f = get_function_from_registry("rpad")
 
         return Expression._from_pyexpr(f(self._expr, length_expr._expr, pad_expr._expr))
 
@@ -4182,7 +4184,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         length_expr = Expression._to_expression(length)
         pad_expr = Expression._to_expression(pad)
-        f = native.get_function_from_registry("lpad")
+        f = get_function_from_registry("lpad")
         return Expression._from_pyexpr(f(self._expr, length_expr._expr, pad_expr._expr))
 
     def repeat(self, n: int | Expression) -> Expression:
@@ -4212,7 +4214,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         n_expr = Expression._to_expression(n)
-        f = native.get_function_from_registry("repeat")
+        f = get_function_from_registry("repeat")
         return Expression._from_pyexpr(f(self._expr, n_expr._expr))
 
     def like(self, pattern: str | Expression) -> Expression:
@@ -4245,7 +4247,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         pattern_expr = Expression._to_expression(pattern)
-        f = native.get_function_from_registry("like")
+        f = get_function_from_registry("like")
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr))
 
     def ilike(self, pattern: str | Expression) -> Expression:
@@ -4278,7 +4280,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         pattern_expr = Expression._to_expression(pattern)
-        f = native.get_function_from_registry("ilike")
+        f = get_function_from_registry("ilike")
         return Expression._from_pyexpr(f(self._expr, pattern_expr._expr))
 
     def substr(self, start: int | Expression, length: int | Expression | None = None) -> Expression:
@@ -4312,7 +4314,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         start_expr = Expression._to_expression(start)
         length_expr = Expression._to_expression(length)
-        f = native.get_function_from_registry("substr")
+        f = get_function_from_registry("substr")
         return Expression._from_pyexpr(f(self._expr, start_expr._expr, length_expr._expr))
 
     def to_date(self, format: str) -> Expression:
@@ -4345,7 +4347,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         """
         format_expr = Expression._to_expression(format)._expr
-        f = native.get_function_from_registry("to_date")
+        f = get_function_from_registry("to_date")
         return Expression._from_pyexpr(f(self._expr, format=format_expr))
 
     def to_datetime(self, format: str, timezone: str | None = None) -> Expression:
@@ -4400,7 +4402,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         """
         format_expr = Expression._to_expression(format)._expr
         timezone_expr = Expression._to_expression(timezone)._expr
-        f = native.get_function_from_registry("to_datetime")
+        f = get_function_from_registry("to_datetime")
         return Expression._from_pyexpr(f(self._expr, format=format_expr, timezone=timezone_expr))
 
     def normalize(
@@ -4452,7 +4454,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
         lowercase_expr = Expression._to_expression(lowercase)._expr
         nfd_unicode_expr = Expression._to_expression(nfd_unicode)._expr
         white_space_expr = Expression._to_expression(white_space)._expr
-        f = native.get_function_from_registry("normalize")
+        f = get_function_from_registry("normalize")
         return Expression._from_pyexpr(
             f(
                 self._expr,
@@ -4570,7 +4572,7 @@ class ExpressionStringNamespace(ExpressionNamespace):
 
         whole_words_expr = Expression._to_expression(whole_words)._expr
         case_sensitive_expr = Expression._to_expression(case_sensitive)._expr
-        f = native.get_function_from_registry("count_matches")
+        f = get_function_from_registry("count_matches")
 
         return Expression._from_pyexpr(
             f(self._expr, patterns._expr, whole_words=whole_words_expr, case_sensitive=case_sensitive_expr)
@@ -5124,7 +5126,7 @@ class ExpressionImageNamespace(ExpressionNamespace):
         """
         image_mode = Expression._to_expression(mode)._expr
         raise_on_error = lit(on_error)._expr
-        f = native.get_function_from_registry("image_decode")
+        f = get_function_from_registry("image_decode")
 
         return Expression._from_pyexpr(f(self._expr, on_error=raise_on_error, mode=image_mode))
 
@@ -5141,7 +5143,7 @@ class ExpressionImageNamespace(ExpressionNamespace):
             image_format = ImageFormat.from_format_string(image_format.upper())
         if not isinstance(image_format, ImageFormat):
             raise ValueError(f"image_format must be a string or ImageFormat variant, but got: {image_format}")
-        f = native.get_function_from_registry("image_encode")
+        f = get_function_from_registry("image_encode")
         image_format_expr = lit(image_format)._expr
         return Expression._from_pyexpr(f(self._expr, image_format=image_format_expr))
 
@@ -5157,7 +5159,7 @@ class ExpressionImageNamespace(ExpressionNamespace):
         """
         width = lit(w)._expr
         height = lit(h)._expr
-        f = native.get_function_from_registry("image_resize")
+        f = get_function_from_registry("image_resize")
         return Expression._from_pyexpr(f(self._expr, w=width, h=height))
 
     def crop(self, bbox: tuple[int, int, int, int] | Expression) -> Expression:
@@ -5178,7 +5180,7 @@ class ExpressionImageNamespace(ExpressionNamespace):
                 )
             bbox = Expression._to_expression(bbox).cast(DataType.fixed_size_list(DataType.uint64(), 4))
         assert isinstance(bbox, Expression)
-        f = native.get_function_from_registry("image_crop")
+        f = get_function_from_registry("image_crop")
         return Expression._from_pyexpr(f(self._expr, bbox._expr))
 
     def to_mode(self, mode: str | ImageMode) -> Expression:
@@ -5187,7 +5189,7 @@ class ExpressionImageNamespace(ExpressionNamespace):
         if not isinstance(mode, ImageMode):
             raise ValueError(f"mode must be a string or ImageMode variant, but got: {mode}")
         image_mode = lit(mode)._expr
-        f = native.get_function_from_registry("to_mode")
+        f = get_function_from_registry("to_mode")
         return Expression._from_pyexpr(f(self._expr, mode=image_mode))
 
 
@@ -5293,7 +5295,7 @@ class ExpressionJsonNamespace(ExpressionNamespace):
             DeprecationWarning,
             stacklevel=2,
         )
-        f = native.get_function_from_registry("jq")
+        f = get_function_from_registry("jq")
         filter = Expression._to_expression(jq_query)._expr
 
         return Expression._from_pyexpr(f(self._expr, filter))
@@ -138,7 +138,7 @@ def make_deltalake_add_action(
 
     # remove leading slash
     path = path[1:] if path.startswith("/") else path
-    return AddAction(
+    add_action = AddAction(
         path,
         size,
         partition_values,
@@ -146,6 +146,14 @@ def make_deltalake_add_action(
         True,
         json.dumps(stats, cls=DeltaJSONEncoder),
     )
+    try:
+        # Stash the typed record count so downstream consumers (e.g. write_deltalake's result
+        # bookkeeping) don't need to re-parse the stats JSON per file. AddAction is an upstream
+        # deltalake dataclass, so tolerate versions that reject dynamic attributes.
+        add_action.num_records = stats["numRecords"]
+    except AttributeError:
+        pass
+    return add_action
 
 
 def make_deltalake_fs(path: str, io_config: IOConfig | None = None) -> pafs.PyFileSystem:
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import turbopuffer
 
 from daft.datatype import DataType
-from daft.dependencies import pc
+from daft.dependencies import pa, pc
 from daft.expressions import ExpressionsProjection
 from daft.io import DataSink
 from daft.io.sink import WriteResult
@@ -18,7 +18,6 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from types import ModuleType
 
-    from daft.dependencies import pa
     from daft.expressions import Expression
 
 
@@ -27,6 +26,10 @@ class TurbopufferDataSink(DataSink[turbopuffer.types.NamespaceWriteResponse]):
 
     _namespace: str | ExpressionsProjection
 
+    # Coalesce rows per namespace until this many Arrow bytes are buffered before issuing a
+    # single write request, amortizing per-request network overhead across micropartitions.
+    _MAX_BATCH_BYTES = 8 * 1024 * 1024
+
     @staticmethod
     def _import_turbopuffer() -> ModuleType:
         try:
@@ -150,51 +153,73 @@ class TurbopufferDataSink(DataSink[turbopuffer.types.NamespaceWriteResponse]):
 
         return arrow_table.filter(~pc.field("id").is_null())
 
+    def _flush_namespace(
+        self,
+        tpuf: turbopuffer.Turbopuffer,
+        namespace_handles: dict[str, Any],
+        namespace_name: str,
+        tables: list[pa.Table],
+        write_kwargs: dict[str, Any],
+    ) -> WriteResult[turbopuffer.types.NamespaceWriteResponse]:
+        """Issues a single write request for all rows buffered for a namespace."""
+        # concat_tables is zero-copy: the buffered tables become chunks of one table.
+        arrow_table = tables[0] if len(tables) == 1 else pa.concat_tables(tables)
+        namespace = namespace_handles.get(namespace_name)
+        if namespace is None:
+            namespace = namespace_handles[namespace_name] = tpuf.namespace(namespace_name)
+        write_response = namespace.write(
+            upsert_rows=arrow_table.to_pylist(),
+            **write_kwargs,
+        )
+        return WriteResult(
+            result=write_response,
+            bytes_written=arrow_table.nbytes,
+            rows_written=arrow_table.num_rows,
+        )
+
     def write(
         self, micropartitions: Iterator[MicroPartition]
     ) -> Iterator[WriteResult[turbopuffer.types.NamespaceWriteResponse]]:
-        """Writes micropartitions to Turbopuffer namespace(s)."""
+        """Writes micropartitions to Turbopuffer namespace(s), coalescing small batches per namespace."""
         turbopuffer = TurbopufferDataSink._import_turbopuffer()
         tpuf = turbopuffer.Turbopuffer(**self._client_kwargs)
 
-        for micropartition in micropartitions:
-            if isinstance(self._namespace, str):
-                # Namespace is a string. Write all data to this namespace.
-                arrow_table = self._prepare_arrow_table(micropartition.to_arrow())
+        namespace_is_str = isinstance(self._namespace, str)
+        if namespace_is_str:
+            write_kwargs = self._write_kwargs
+        else:
+            write_kwargs = {"distance_metric": self._distance_metric, "schema": self._schema}
 
-                namespace = tpuf.namespace(self._namespace)
-                write_response = namespace.write(
-                    upsert_rows=arrow_table.to_pylist(),
-                    **self._write_kwargs,
-                )
+        buffered_tables: dict[str, list[pa.Table]] = {}
+        buffered_bytes: dict[str, int] = {}
+        # Namespace handles are reused across flushes for the lifetime of this write stream.
+        namespace_handles: dict[str, Any] = {}
 
-                yield WriteResult(
-                    result=write_response,
-                    bytes_written=arrow_table.nbytes,
-                    rows_written=arrow_table.num_rows,
-                )
+        for micropartition in micropartitions:
+            if namespace_is_str:
+                # Namespace is a string. Write all data to this namespace.
+                prepared = [(self._namespace, self._prepare_arrow_table(micropartition.to_arrow()))]
             else:
                 # Namespace is an expression. Partition the data by namespace then write to each namespace.
                 (partitioned_data, partition_keys) = micropartition.partition_by_value(self._namespace)
+                prepared = []
                 for data, namespace_name in zip(partitioned_data, partition_keys.get_column(0)):
                     if len(data) == 0:
                         continue
-
-                    arrow_table = self._prepare_arrow_table(data.to_arrow())
-
                     TurbopufferDataSink._check_namespace_name(namespace_name)
-                    namespace = tpuf.namespace(namespace_name)
-                    write_response = namespace.write(
-                        upsert_rows=arrow_table.to_pylist(),
-                        distance_metric=self._distance_metric,
-                        schema=self._schema,
+                    prepared.append((namespace_name, self._prepare_arrow_table(data.to_arrow())))
+
+            for namespace_name, arrow_table in prepared:
+                buffered_tables.setdefault(namespace_name, []).append(arrow_table)
+                buffered_bytes[namespace_name] = buffered_bytes.get(namespace_name, 0) + arrow_table.nbytes
+                if buffered_bytes[namespace_name] >= self._MAX_BATCH_BYTES:
+                    yield self._flush_namespace(
+                        tpuf, namespace_handles, namespace_name, buffered_tables.pop(namespace_name), write_kwargs
                     )
+                    del buffered_bytes[namespace_name]
 
-                    yield WriteResult(
-                        result=write_response,
-                        bytes_written=arrow_table.nbytes,
-                        rows_written=arrow_table.num_rows,
-                    )
+        for namespace_name, tables in buffered_tables.items():
+            yield self._flush_namespace(tpuf, namespace_handles, namespace_name, tables, write_kwargs)
 
     def finalize(self, write_results: list[WriteResult[turbopuffer.types.NamespaceWriteResponse]]) -> MicroPartition:
         """Finalizes the write process and returns summary statistics."""
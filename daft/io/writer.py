@@ -204,6 +204,9 @@ class CSVFileWriter(FileWriterBase):
 
     def write(self, table: MicroPartition) -> int:
         assert not self.is_closed, "Cannot write to a closed CSVFileWriter"
+        # The writer (and its output stream) is created once per file and reused across incoming
+        # batches, so formatter setup is amortized and each batch serializes in a single
+        # `write_table` call rather than row-by-row.
         if self.current_writer is None:
             self.current_writer = self._create_writer(table.schema().to_pyarrow_schema())
         self.current_writer.write_table(table.to_arrow())
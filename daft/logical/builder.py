@@ -21,6 +21,7 @@ from daft.logical.schema import Schema
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import Sequence
 
     from pyiceberg.table import Table as IcebergTable
 
@@ -120,6 +121,14 @@ class LogicalPlanBuilder:
         builder = self._builder.optimize()
         return LogicalPlanBuilder(builder)
 
+    def is_provably_empty(self) -> bool:
+        """Returns whether the plan is statically guaranteed to produce zero rows (e.g. contains a `LIMIT 0`)."""
+        return self._builder.is_provably_empty()
+
+    def num_rows_from_stats(self) -> int | None:
+        """Returns the plan's exact row count if it is statically known from source metadata, else None."""
+        return self._builder.num_rows_from_stats()
+
     @classmethod
     @_apply_daft_planning_config_to_initializer
     def from_in_memory_scan(
@@ -163,6 +172,12 @@ class LogicalPlanBuilder:
         builder = self._builder.with_columns(column_pyexprs)
         return LogicalPlanBuilder(builder)
 
+    def with_columns_named(self, columns: dict[str, Expression]) -> LogicalPlanBuilder:
+        """Adds columns under the given names, applying the aliases Rust-side in a single call."""
+        column_pyexprs = [expr._expr for expr in columns.values()]
+        builder = self._builder.with_columns_named(list(columns.keys()), column_pyexprs)
+        return LogicalPlanBuilder(builder)
+
     def with_column_renamed(self, existing: str, new: str) -> LogicalPlanBuilder:
         cols_map = {existing: new}
         builder = self._builder.with_columns_renamed(cols_map)
@@ -172,7 +187,8 @@ class LogicalPlanBuilder:
         builder = self._builder.with_columns_renamed(cols_map)
         return LogicalPlanBuilder(builder)
 
-    def exclude(self, to_exclude: list[str]) -> LogicalPlanBuilder:
+    def exclude(self, to_exclude: Sequence[str]) -> LogicalPlanBuilder:
+        # PyO3 extracts Vec<String> from any sequence, so tuples pass through without a copy.
         builder = self._builder.exclude(to_exclude)
         return LogicalPlanBuilder(builder)
 
@@ -237,6 +253,11 @@ class LogicalPlanBuilder:
         builder = self._builder.sort(sort_by_pyexprs, descending, nulls_first)
         return LogicalPlanBuilder(builder)
 
+    def sort_single_asc(self, by: str) -> LogicalPlanBuilder:
+        """Specialized single-column ascending sort (nulls last) that skips `sort`'s flag broadcasting."""
+        builder = self._builder.sort([col(by)._expr], [False], [False])
+        return LogicalPlanBuilder(builder)
+
     def hash_repartition(self, num_partitions: int | None, partition_by: list[Expression]) -> LogicalPlanBuilder:
         partition_by_pyexprs = [expr._expr for expr in partition_by]
         builder = self._builder.hash_repartition(partition_by_pyexprs, num_partitions=num_partitions)
@@ -259,6 +280,12 @@ class LogicalPlanBuilder:
         builder = self._builder.aggregate([expr._expr for expr in to_agg], group_by_pyexprs)
         return LogicalPlanBuilder(builder)
 
+    def agg_all(self, op: str, to_agg: list[Expression], group_by: list[Expression] | None) -> LogicalPlanBuilder:
+        """Applies the named agg op to every expression Rust-side in one batched call."""
+        group_by_pyexprs = [expr._expr for expr in group_by] if group_by is not None else []
+        builder = self._builder.agg_all(op, [expr._expr for expr in to_agg], group_by_pyexprs)
+        return LogicalPlanBuilder(builder)
+
     def map_groups(self, udf: Expression, group_by: list[Expression] | None) -> LogicalPlanBuilder:
         group_by_pyexprs = [expr._expr for expr in group_by] if group_by is not None else []
         builder = self._builder.aggregate([udf._expr], group_by_pyexprs)
@@ -297,6 +324,15 @@ class LogicalPlanBuilder:
         )
         return LogicalPlanBuilder(builder)
 
+    def cross_join(
+        self,
+        right: LogicalPlanBuilder,
+        prefix: str | None = None,
+        suffix: str | None = None,
+    ) -> LogicalPlanBuilder:
+        builder = self._builder.cross_join(right._builder, prefix, suffix)
+        return LogicalPlanBuilder(builder)
+
     def concat(self, other: LogicalPlanBuilder) -> LogicalPlanBuilder:
         builder = self._builder.concat(other._builder)
         return LogicalPlanBuilder(builder)
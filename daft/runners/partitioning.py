@@ -11,6 +11,8 @@ from daft.datatype import TimeUnit
 from daft.recordbatch import MicroPartition
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import pandas as pd
     import pyarrow as pa
     from ray import ObjectRef
@@ -238,6 +240,10 @@ class PartitionSet(Generic[PartitionT]):
     def values(self) -> list[MaterializedResult[PartitionT]]:
         return [value for _, value in self.items()]
 
+    def iter_values(self) -> Iterator[MaterializedResult[PartitionT]]:
+        """Iterates over partitions ordered by partition ID without materializing a values list."""
+        return (value for _, value in self.items())
+
     @abstractmethod
     def get_partition(self, idx: PartID) -> MaterializedResult[PartitionT]:
         raise NotImplementedError()
@@ -280,9 +286,17 @@ class LocalPartitionSet(PartitionSet[MicroPartition]):
 
     @staticmethod
     def _from_micropartition_set(pset: PyMicroPartitionSet) -> LocalPartitionSet:
+        return LocalPartitionSet.from_tables(
+            MicroPartition._from_pymicropartition(pset.get_partition(idx)) for idx in range(pset.num_partitions())
+        )
+
+    @staticmethod
+    def from_tables(parts: Iterable[MicroPartition]) -> LocalPartitionSet:
+        """Creates a LocalPartitionSet with all partitions set in one shot, partition IDs assigned by position."""
         s = LocalPartitionSet()
-        for idx in range(0, pset.num_partitions()):
-            s.set_partition_from_table(idx=idx, part=MicroPartition._from_pymicropartition(pset.get_partition(idx)))
+        s._partitions = {
+            idx: LocalMaterializedResult(part, PartitionMetadata.from_table(part)) for idx, part in enumerate(parts)
+        }
         return s
 
     def items(self) -> list[tuple[PartID, MaterializedResult[MicroPartition]]]:
@@ -338,6 +352,18 @@ class LocalPartitionSet(PartitionSet[MicroPartition]):
     def num_partitions(self) -> int:
         return len(self._partitions)
 
+    def stats(self) -> tuple[int, int | None, int]:
+        """Returns (num_partitions, size_bytes, num_rows) in a single pass over the partitions."""
+        num_rows = 0
+        size_bytes: int | None = 0
+        for mat_result in self._partitions.values():
+            part = mat_result.partition()
+            num_rows += len(part)
+            if size_bytes is not None:
+                part_size = part.size_bytes()
+                size_bytes = None if part_size is None else size_bytes + part_size
+        return len(self._partitions), size_bytes, num_rows
+
     def wait(self) -> None:
         pass
 
@@ -395,6 +421,13 @@ class PartitionCacheEntry:
     def num_rows(self) -> int | None:
         return len(self.value) if self.value is not None else None
 
+    def metadata(self) -> tuple[int | None, int | None, int | None]:
+        """Returns `(num_partitions, size_bytes, num_rows)` from a single read of the cached value."""
+        value = self.value
+        if value is None:
+            return None, None, None
+        return value.num_partitions(), value.size_bytes(), len(value)
+
 
 class PartitionSetCache:
     def __init__(self) -> None:
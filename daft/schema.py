@@ -106,11 +106,17 @@ class Schema:
     def to_pyarrow_schema(self) -> pa.Schema:
         """Converts a Daft Schema to a PyArrow Schema.
 
+        The converted schema is cached on this instance, which is safe since Schemas are
+        immutable; repeated calls (e.g. one per file writer) reuse the first conversion.
+
         Returns:
             pa.Schema: PyArrow schema that corresponds to the provided Daft schema
         """
-        _ensure_registered_super_ext_type()
-        return self._schema.to_pyarrow_schema()
+        pa_schema = getattr(self, "_pyarrow_schema", None)
+        if pa_schema is None:
+            _ensure_registered_super_ext_type()
+            pa_schema = self._pyarrow_schema = self._schema.to_pyarrow_schema()
+        return pa_schema
 
     @classmethod
     def _from_field_name_and_types(self, fields: list[tuple[str, DataType]]) -> Schema:
@@ -152,6 +158,16 @@ class Schema:
         """
         return list(self._schema.names())
 
+    def float_column_names(self) -> list[str]:
+        """Returns the names of the schema's Float32/Float64 columns, in schema order.
+
+        Args:
+            None
+        Returns:
+            list[str]: List of floating-point column names in the schema.
+        """
+        return self._schema.float_column_names()
+
     def estimate_row_size_bytes(self) -> float:
         """Estimates the size of a row in bytes based on the schema.
 
@@ -169,6 +185,18 @@ class Schema:
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Schema) and self._schema == other._schema
 
+    def fingerprint(self) -> int:
+        """Returns a 64-bit fingerprint of the schema's field names and types.
+
+        The fingerprint is cached on this instance (Schemas are immutable) and is stable
+        within a process: schemas with differing fingerprints are guaranteed unequal, so it
+        serves as a cheap pre-check before a full field-by-field comparison.
+        """
+        fingerprint = getattr(self, "_fingerprint", None)
+        if fingerprint is None:
+            fingerprint = self._fingerprint = self._schema.fingerprint()
+        return fingerprint
+
     def to_name_set(self) -> set[str]:
         """Returns a set of column names in the schema.
 
@@ -145,6 +145,11 @@ class Session:
 
         Returns:
             Catalog: new daft catalog instance
+
+        Tip:
+            Keep the returned Catalog and call its methods directly when issuing many
+            operations against the same catalog; this skips the per-call name-based
+            session lookup that `get_catalog` performs.
         """
         c = catalog if isinstance(catalog, Catalog) else Catalog._from_obj(catalog)
         a = alias if alias else c.name
@@ -36,15 +36,30 @@ class SQLCatalog:
     def __init__(self, tables: dict[str, DataFrame]) -> None:
         """Create a new SQLCatalog from a dictionary of table names to dataframes."""
         self._catalog = _PySqlCatalog.new()
-        for name, df in tables.items():
-            self._catalog.register_table(name, df._get_current_builder()._builder)
+        self.register_tables(tables)
 
     def __str__(self) -> str:
         return str(self._catalog)
 
     def register_table(self, name: str, df: DataFrame) -> None:
+        # Validate cheaply on the Python side so bad inputs fail with a clear error
+        # before crossing into the native catalog.
+        if not isinstance(name, str) or not name:
+            raise ValueError(f"Table name must be a non-empty string, found: {name!r}")
+        if not isinstance(df, DataFrame):
+            raise TypeError(f"Expected a DataFrame for table {name!r}, found: {type(df)}")
         self._catalog.register_table(name, df._get_current_builder()._builder)
 
+    def register_tables(self, tables: dict[str, DataFrame]) -> None:
+        """Register many tables at once, hoisting the per-call native method lookup out of the loop."""
+        register = self._catalog.register_table
+        for name, df in tables.items():
+            if not isinstance(name, str) or not name:
+                raise ValueError(f"Table name must be a non-empty string, found: {name!r}")
+            if not isinstance(df, DataFrame):
+                raise TypeError(f"Expected a DataFrame for table {name!r}, found: {type(df)}")
+            register(name, df._get_current_builder()._builder)
+
     def _copy_from(self, other: "SQLCatalog") -> None:
         self._catalog.copy_from(other._catalog)
 
@@ -114,15 +114,21 @@ def is_column_input(x: Any) -> bool:
     return isinstance(x, str) or isinstance(x, Expression)
 
 
-def column_inputs_to_expressions(columns: ManyColumnsInputType) -> list[Expression]:
+def column_inputs_to_expressions(*columns: ManyColumnsInputType) -> list[Expression]:
     """Inputs to dataframe operations can be passed in as individual arguments or an iterable.
 
     In addition, they may be strings or Expressions.
-    This method normalizes the inputs to a list of Expressions.
+    This method normalizes the inputs to a list of Expressions, and accepts them either as a
+    single argument or spread across variadic arguments, so wildcard ``*cols`` methods can
+    forward their argument tuple directly without an intermediate unpacking step.
     """
-    from daft.expressions import col
+    from daft.expressions import Expression, col
 
-    column_iter: Iterable[ColumnInputType] = [columns] if is_column_input(columns) else columns  # type: ignore
+    if len(columns) == 1:
+        sole = columns[0]
+        column_iter: Iterable[ColumnInputType] = [sole] if isinstance(sole, (str, Expression)) else sole
+    else:
+        column_iter = columns  # type: ignore[assignment]
     return [col(c) if isinstance(c, str) else c for c in column_iter]
 
 
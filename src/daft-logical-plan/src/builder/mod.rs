@@ -26,6 +26,7 @@ use resolve_expr::ExprResolver;
 use {
     crate::sink_info::{CatalogInfo, IcebergCatalogInfo},
     common_daft_config::PyDaftPlanningConfig,
+    daft_core::count_mode::CountMode,
     daft_dsl::python::PyExpr,
     // daft_scan::python::pylib::ScanOperatorHandle,
     daft_schema::python::schema::PySchema,
@@ -329,6 +330,56 @@ impl LogicalPlanBuilder {
         Ok(self.with_new_plan(logical_plan))
     }
 
+    /// Returns true if the plan is statically guaranteed to produce zero rows, e.g. a `LIMIT 0`
+    /// anywhere on its output path. This lets callers (such as the tabular write methods) skip
+    /// execution entirely for trivially-empty plans.
+    pub fn is_provably_empty(&self) -> bool {
+        fn walk(plan: &LogicalPlan) -> bool {
+            match plan {
+                LogicalPlan::Limit(limit) if limit.limit == 0 => true,
+                // Operators that produce zero rows whenever all of their inputs do.
+                LogicalPlan::Project(_)
+                | LogicalPlan::UDFProject(_)
+                | LogicalPlan::Filter(_)
+                | LogicalPlan::Limit(_)
+                | LogicalPlan::Explode(_)
+                | LogicalPlan::Sort(_)
+                | LogicalPlan::Repartition(_)
+                | LogicalPlan::Distinct(_)
+                | LogicalPlan::Concat(_)
+                | LogicalPlan::Sample(_)
+                | LogicalPlan::MonotonicallyIncreasingId(_)
+                | LogicalPlan::SubqueryAlias(_)
+                | LogicalPlan::Shard(_)
+                | LogicalPlan::TopN(_) => {
+                    let children = plan.children();
+                    !children.is_empty() && children.into_iter().all(walk)
+                }
+                _ => false,
+            }
+        }
+        walk(self.plan.as_ref())
+    }
+
+    /// Returns the exact row count of the plan when it is statically known from source
+    /// metadata (currently an in-memory source, possibly under a chain of projections),
+    /// or `None` when the plan must be executed to count its rows.
+    pub fn num_rows_from_stats(&self) -> Option<usize> {
+        // Projections are cardinality-preserving, so counts over select/with_columns/rename
+        // chains can still answer from the source's metadata.
+        let mut plan = self.plan.as_ref();
+        while let LogicalPlan::Project(project) = plan {
+            plan = project.input.as_ref();
+        }
+        match plan {
+            LogicalPlan::Source(source) => match source.source_info.as_ref() {
+                SourceInfo::InMemory(info) => Some(info.num_rows),
+                _ => None,
+            },
+            _ => None,
+        }
+    }
+
     pub fn shard(&self, strategy: String, world_size: i64, rank: i64) -> DaftResult<Self> {
         let sharder = Sharder::new(
             ShardingStrategy::from(strategy),
@@ -1027,6 +1078,23 @@ impl PyLogicalPlanBuilder {
         Ok(self.builder.with_columns(pyexprs_to_exprs(columns))?.into())
     }
 
+    /// Fused alias + with_columns: applies the target names Rust-side so callers issue a
+    /// single FFI call instead of one alias call per column.
+    pub fn with_columns_named(&self, names: Vec<String>, columns: Vec<PyExpr>) -> PyResult<Self> {
+        let columns = names
+            .into_iter()
+            .zip(pyexprs_to_exprs(columns))
+            .map(|(name, expr)| {
+                if expr.name() == name {
+                    expr
+                } else {
+                    expr.alias(name)
+                }
+            })
+            .collect();
+        Ok(self.builder.with_columns(columns)?.into())
+    }
+
     pub fn with_columns_renamed(&self, cols_map: HashMap<String, String>) -> PyResult<Self> {
         Ok(self.builder.with_columns_renamed(cols_map)?.into())
     }
@@ -1049,6 +1117,14 @@ impl PyLogicalPlanBuilder {
         Ok(self.builder.limit(limit as u64, eager)?.into())
     }
 
+    pub fn is_provably_empty(&self) -> bool {
+        self.builder.is_provably_empty()
+    }
+
+    pub fn num_rows_from_stats(&self) -> Option<usize> {
+        self.builder.num_rows_from_stats()
+    }
+
     pub fn shard(&self, strategy: String, world_size: i64, rank: i64) -> PyResult<Self> {
         Ok(self.builder.shard(strategy, world_size, rank)?.into())
     }
@@ -1148,6 +1224,34 @@ impl PyLogicalPlanBuilder {
             .into())
     }
 
+    /// Batched aggregation: applies the named agg op to every expression Rust-side, so
+    /// wide column-wise aggs issue one FFI call instead of one expression call per column.
+    pub fn agg_all(&self, op: &str, exprs: Vec<PyExpr>, groupby_exprs: Vec<PyExpr>) -> PyResult<Self> {
+        let agg_exprs = pyexprs_to_exprs(exprs)
+            .into_iter()
+            .map(|e| match op {
+                "sum" => Ok(e.sum()),
+                "mean" => Ok(e.mean()),
+                "stddev" => Ok(e.stddev()),
+                "min" => Ok(e.min()),
+                "max" => Ok(e.max()),
+                "any_value" => Ok(e.any_value(false)),
+                "count" => Ok(e.count(CountMode::Valid)),
+                "skew" => Ok(e.skew()),
+                "agg_list" => Ok(e.agg_list()),
+                "agg_set" => Ok(e.agg_set()),
+                "agg_concat" => Ok(e.agg_concat()),
+                _ => Err(pyo3::exceptions::PyValueError::new_err(format!(
+                    "Unsupported agg_all op: {op}"
+                ))),
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(self
+            .builder
+            .aggregate(agg_exprs, pyexprs_to_exprs(groupby_exprs))?
+            .into())
+    }
+
     pub fn pivot(
         &self,
         group_by: Vec<PyExpr>,
@@ -1226,6 +1330,21 @@ impl PyLogicalPlanBuilder {
             .into())
     }
 
+    /// Dedicated cross-join entry: skips the key-pairing logic of `join` entirely, since a
+    /// cross join has no key expressions to resolve.
+    #[pyo3(signature = (right, prefix=None, suffix=None))]
+    pub fn cross_join(
+        &self,
+        right: &Self,
+        prefix: Option<String>,
+        suffix: Option<String>,
+    ) -> PyResult<Self> {
+        Ok(self
+            .builder
+            .cross_join(&right.builder, JoinOptions { prefix, suffix })?
+            .into())
+    }
+
     pub fn concat(&self, other: &Self) -> DaftResult<Self> {
         Ok(self.builder.concat(&other.builder)?.into())
     }
@@ -8,7 +8,8 @@ use super::{
     rules::{
         DetectMonotonicId, DropRepartition, EliminateCrossJoin, EliminateSubqueryAliasRule,
         EnrichWithStats, ExtractWindowFunction, FilterNullJoinKey, LiftProjectFromAgg,
-        MaterializeScans, OptimizerRule, PushDownAntiSemiJoin, PushDownFilter,
+        MaterializeScans, OptimizerRule, PushDistinctThroughProject, PushDownAntiSemiJoin,
+        PushDownFilter,
         PushDownJoinPredicate, PushDownLimit, PushDownProjection, ReorderJoins,
         RewriteCountDistinct, SimplifyExpressionsRule, SimplifyNullFilteredJoin,
         SplitGranularProjection, SplitUDFs, UnnestPredicateSubquery, UnnestScalarSubquery,
@@ -128,6 +129,14 @@ impl Default for OptimizerBuilder {
                     vec![Box::new(PushDownAntiSemiJoin::new())],
                     RuleExecutionStrategy::FixedPoint(None),
                 ),
+                // --- Push subset distincts below computed projections ---
+                // This must run once, before PushDownProjection: PushDownProjection inserts a
+                // pass-through Project under subset distincts, so running both in the same
+                // fixed-point batch would have them re-swap the same pair forever.
+                RuleBatch::new(
+                    vec![Box::new(PushDistinctThroughProject::new())],
+                    RuleExecutionStrategy::Once,
+                ),
                 // --- Bulk of our rules ---
                 RuleBatch::new(
                     vec![
@@ -8,6 +8,7 @@ mod filter_null_join_key;
 mod granular_projections;
 mod lift_project_from_agg;
 mod materialize_scans;
+mod push_distinct_through_project;
 mod push_down_anti_semi_join;
 mod push_down_filter;
 mod push_down_join_predicate;
@@ -34,6 +35,7 @@ pub use filter_null_join_key::FilterNullJoinKey;
 pub use granular_projections::SplitGranularProjection;
 pub use lift_project_from_agg::LiftProjectFromAgg;
 pub use materialize_scans::MaterializeScans;
+pub use push_distinct_through_project::PushDistinctThroughProject;
 pub use push_down_anti_semi_join::PushDownAntiSemiJoin;
 pub use push_down_filter::PushDownFilter;
 pub use push_down_join_predicate::PushDownJoinPredicate;
@@ -0,0 +1,195 @@
+use std::sync::Arc;
+
+use common_error::DaftResult;
+use common_treenode::{Transformed, TreeNode};
+use daft_dsl::{
+    optimization::requires_computation, resolved_col, Column, Expr, ExprRef, ResolvedColumn,
+};
+
+use super::OptimizerRule;
+use crate::{
+    ops::{Distinct, Project},
+    LogicalPlan,
+};
+
+/// Optimization rule that pushes a `Distinct` with a column subset below a `Project`,
+/// so the projection's computed columns are only evaluated on the surviving rows.
+///
+/// The swap is valid when every distinct key is a plain passthrough of an input column in
+/// the projection (a bare column reference, possibly renamed via alias): the key values
+/// are then identical on either side of the projection, and the non-key columns of a
+/// subset-distinct are already non-deterministic representatives of their group.
+///
+/// Input:  `Distinct(on=["a"]) <- Project["a", f("b").alias("c")] <- Source`
+///
+/// Output: `Project["a", f("b").alias("c")] <- Distinct(on=["a"]) <- Source`
+#[derive(Default, Debug)]
+pub struct PushDistinctThroughProject {}
+
+impl PushDistinctThroughProject {
+    pub fn new() -> Self {
+        Self {}
+    }
+
+    /// Returns the input-column name an expression passes through unchanged, if any
+    /// (a bare column reference, possibly wrapped in aliases).
+    fn passthrough_input_name(expr: &ExprRef) -> Option<&str> {
+        match expr.as_ref() {
+            Expr::Alias(child, _) => Self::passthrough_input_name(child),
+            Expr::Column(Column::Resolved(ResolvedColumn::Basic(name))) => Some(name.as_ref()),
+            _ => None,
+        }
+    }
+}
+
+impl OptimizerRule for PushDistinctThroughProject {
+    fn try_optimize(&self, plan: Arc<LogicalPlan>) -> DaftResult<Transformed<Arc<LogicalPlan>>> {
+        plan.transform_down(|node| {
+            let LogicalPlan::Distinct(distinct) = node.as_ref() else {
+                return Ok(Transformed::no(node));
+            };
+            let Some(subset) = &distinct.columns else {
+                // Distinct on all columns depends on every projected value; cannot swap.
+                return Ok(Transformed::no(node));
+            };
+            let LogicalPlan::Project(project) = distinct.input.as_ref() else {
+                return Ok(Transformed::no(node));
+            };
+            // Only worth swapping when the projection actually computes something; pure
+            // renames/passthroughs cost nothing per row.
+            if !project
+                .projection
+                .iter()
+                .any(|e| requires_computation(e.as_ref()))
+            {
+                return Ok(Transformed::no(node));
+            }
+
+            // Map each distinct key through the projection back to its input column,
+            // bailing out if any key is not a simple passthrough.
+            let mut mapped_subset = Vec::with_capacity(subset.len());
+            for key in subset {
+                let Expr::Column(Column::Resolved(ResolvedColumn::Basic(key_name))) = key.as_ref()
+                else {
+                    return Ok(Transformed::no(node));
+                };
+                let Some(projected) = project
+                    .projection
+                    .iter()
+                    .find(|e| e.name() == key_name.as_ref())
+                else {
+                    return Ok(Transformed::no(node));
+                };
+                let Some(input_name) = Self::passthrough_input_name(projected) else {
+                    return Ok(Transformed::no(node));
+                };
+                mapped_subset.push(resolved_col(input_name));
+            }
+
+            let new_distinct =
+                LogicalPlan::Distinct(Distinct::new(project.input.clone(), Some(mapped_subset)))
+                    .arced();
+            let new_project =
+                LogicalPlan::Project(Project::try_new(new_distinct, project.projection.clone())?)
+                    .arced();
+            Ok(Transformed::yes(new_project))
+        })
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use std::sync::Arc;
+
+    use common_error::DaftResult;
+    use daft_core::prelude::*;
+    use daft_dsl::{lit, unresolved_col};
+
+    use crate::{
+        optimization::{
+            optimizer::{RuleBatch, RuleExecutionStrategy},
+            rules::PushDistinctThroughProject,
+            test::assert_optimized_plan_with_rules_eq,
+        },
+        test::{dummy_scan_node, dummy_scan_operator},
+        LogicalPlan,
+    };
+
+    /// Helper that creates an optimizer with the PushDistinctThroughProject rule registered,
+    /// optimizes the provided plan with said optimizer, and compares the optimized plan with
+    /// the provided expected plan.
+    fn assert_optimized_plan_eq(
+        plan: Arc<LogicalPlan>,
+        expected: Arc<LogicalPlan>,
+    ) -> DaftResult<()> {
+        assert_optimized_plan_with_rules_eq(
+            plan,
+            expected,
+            vec![RuleBatch::new(
+                vec![Box::new(PushDistinctThroughProject::new())],
+                RuleExecutionStrategy::Once,
+            )],
+        )
+    }
+
+    /// Tests that a subset Distinct is pushed below a projection with computed columns.
+    ///
+    /// Distinct(on=["a"])-Project["a", ("b" == 1).alias("c")] -> Project-Distinct(on=["a"])
+    #[test]
+    fn distinct_subset_pushed_below_computed_projection() -> DaftResult<()> {
+        let scan_op = dummy_scan_operator(vec![
+            Field::new("a", DataType::Int64),
+            Field::new("b", DataType::Int64),
+        ]);
+        let projection = vec![
+            unresolved_col("a"),
+            unresolved_col("b").eq(lit(1)).alias("c"),
+        ];
+        let plan = dummy_scan_node(scan_op.clone())
+            .select(projection.clone())?
+            .distinct(Some(vec![unresolved_col("a")]))?
+            .build();
+        let expected = dummy_scan_node(scan_op)
+            .distinct(Some(vec![unresolved_col("a")]))?
+            .select(projection)?
+            .build();
+        assert_optimized_plan_eq(plan, expected)?;
+        Ok(())
+    }
+
+    /// Tests that a Distinct over all columns is not pushed below a projection.
+    #[test]
+    fn full_distinct_not_pushed_below_projection() -> DaftResult<()> {
+        let scan_op = dummy_scan_operator(vec![
+            Field::new("a", DataType::Int64),
+            Field::new("b", DataType::Int64),
+        ]);
+        let plan = dummy_scan_node(scan_op)
+            .select(vec![
+                unresolved_col("a"),
+                unresolved_col("b").eq(lit(1)).alias("c"),
+            ])?
+            .distinct(None)?
+            .build();
+        assert_optimized_plan_eq(plan.clone(), plan)?;
+        Ok(())
+    }
+
+    /// Tests that a Distinct keyed on a computed projected column is not pushed down.
+    #[test]
+    fn distinct_on_computed_key_not_pushed_below_projection() -> DaftResult<()> {
+        let scan_op = dummy_scan_operator(vec![
+            Field::new("a", DataType::Int64),
+            Field::new("b", DataType::Int64),
+        ]);
+        let plan = dummy_scan_node(scan_op)
+            .select(vec![
+                unresolved_col("a"),
+                unresolved_col("b").eq(lit(1)).alias("c"),
+            ])?
+            .distinct(Some(vec![unresolved_col("c")]))?
+            .build();
+        assert_optimized_plan_eq(plan.clone(), plan)?;
+        Ok(())
+    }
+}
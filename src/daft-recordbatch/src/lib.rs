@@ -341,10 +341,13 @@ impl RecordBatch {
         offset: u64,
         column_name: &str,
     ) -> DaftResult<Self> {
-        // Use the leftmost 28 bits for the partition number and the rightmost 36 bits for the row number
+        // Use the leftmost 28 bits for the partition number and the rightmost 36 bits for the row number.
+        // The partition prefix is pre-OR'd into the range start, so id generation is a plain
+        // sequential u64 range; collecting the bare Range (no step_by adaptor) keeps the
+        // TrustedLen specialization that LLVM unrolls and vectorizes.
         let start = (partition_num << 36) + offset;
         let end = start + self.len() as u64;
-        let ids = (start..end).step_by(1).collect::<Vec<_>>();
+        let ids = (start..end).collect::<Vec<_>>();
         let id_series = UInt64Array::from((column_name, ids)).into_series();
         Self::from_nonempty_columns([&[id_series], &self.columns[..]].concat())
     }
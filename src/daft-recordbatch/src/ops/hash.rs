@@ -71,7 +71,6 @@ impl RecordBatch {
     pub fn to_idx_hash_table(&self) -> DaftResult<HashMap<IndexHash, (), IdentityBuildHasher>> {
         let hashes = self.hash_rows()?;
 
-        const DEFAULT_SIZE: usize = 20;
         let comparator = build_multi_array_is_equal(
             self.columns.as_slice(),
             self.columns.as_slice(),
@@ -79,9 +78,11 @@ impl RecordBatch {
             vec![true; self.columns.len()].as_slice(),
         )?;
 
+        // The row count upper-bounds the number of unique keys; sizing the table up front
+        // avoids rehashing every resident entry on each growth step of the insert loop.
         let mut idx_hash_table =
             HashMap::<IndexHash, (), IdentityBuildHasher>::with_capacity_and_hasher(
-                DEFAULT_SIZE,
+                hashes.len(),
                 Default::default(),
             );
         // TODO(Sammy): Drop nulls using validity array if requested
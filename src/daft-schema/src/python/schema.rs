@@ -5,7 +5,7 @@ use pyo3::prelude::*;
 use serde::{Deserialize, Serialize};
 
 use super::{datatype::PyDataType, field::PyField};
-use crate::{field::Field, schema};
+use crate::{field::Field, prelude::DataType, schema};
 
 #[pyclass(module = "daft.daft", eq)]
 #[derive(Debug, Clone, Serialize, Deserialize, PartialEq, Eq)]
@@ -55,6 +55,17 @@ impl PySchema {
         self.schema.names()
     }
 
+    /// Names of the schema's Float32/Float64 columns, in schema order.
+    #[must_use]
+    pub fn float_column_names(&self) -> Vec<String> {
+        self.schema
+            .fields()
+            .iter()
+            .filter(|f| matches!(f.dtype, DataType::Float32 | DataType::Float64))
+            .map(|f| f.name.clone())
+            .collect()
+    }
+
     pub fn union(&self, other: &Self) -> PyResult<Self> {
         let new_schema = Arc::new(self.schema.union(&other.schema)?);
         Ok(new_schema.into())
@@ -64,6 +75,16 @@ impl PySchema {
         Ok(self.schema.estimate_row_size_bytes())
     }
 
+    /// Returns a 64-bit fingerprint of the schema's fields; stable within a process, so two
+    /// schemas with differing fingerprints are guaranteed unequal.
+    #[must_use]
+    pub fn fingerprint(&self) -> u64 {
+        use std::hash::{Hash, Hasher};
+        let mut hasher = std::collections::hash_map::DefaultHasher::new();
+        self.schema.hash(&mut hasher);
+        hasher.finish()
+    }
+
     #[staticmethod]
     pub fn from_field_name_and_types(names_and_types: Vec<(String, PyDataType)>) -> Self {
         let fields = names_and_types
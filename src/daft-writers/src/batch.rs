@@ -48,7 +48,9 @@ impl SizeBasedBuffer {
             return Ok(None);
         }
 
-        let mut tables = Vec::new();
+        // At most every buffered table ends up in this batch, so reserve up front to avoid
+        // growth reallocations while appending.
+        let mut tables = Vec::with_capacity(self.buffer.len());
         let mut bytes_taken = 0;
 
         while let Some((table, size)) = self.buffer.pop_front() {
@@ -1,3 +1,11 @@
+//! Native Parquet writer.
+//!
+//! Concurrency model: each output file gets its own `ParquetWriter` (the writer factories in
+//! `lib.rs` create one per partition/target file), and within a file, each row group fans out
+//! one encode task per arrow leaf column onto the shared compute runtime, capped at the compute
+//! pool size. Encoded column chunks are appended to the row group on the IO runtime so blocking
+//! writes never occupy a compute thread.
+
 use std::{collections::VecDeque, future::Future, path::PathBuf, pin::Pin, sync::Arc};
 
 use async_trait::async_trait;
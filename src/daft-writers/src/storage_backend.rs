@@ -26,8 +26,9 @@ pub(crate) trait StorageBackend: Send + Sync + 'static {
 pub(crate) struct FileStorageBackend {}
 
 impl FileStorageBackend {
-    // Buffer potentially small writes for highly compressed columns.
-    const DEFAULT_WRITE_BUFFER_SIZE: usize = 4 * 1024;
+    // Buffer potentially small writes for highly compressed columns. A larger buffer amortizes
+    // per-syscall overhead by coalescing many small page writes into fewer, larger `write` calls.
+    const DEFAULT_WRITE_BUFFER_SIZE: usize = 256 * 1024;
 }
 
 #[async_trait]
@@ -51,6 +52,12 @@ impl StorageBackend for FileStorageBackend {
     }
 }
 
+/// Storage backend that buffers writes in memory and uploads them to S3 as multipart parts.
+///
+/// Writers emit many small page/chunk writes; the `S3PartBuffer` coalesces them into
+/// `S3_MULTIPART_PART_SIZE` parts so each PUT to the object store carries a full part rather
+/// than paying a round trip per page. Parts are uploaded concurrently by a background task on
+/// the IO runtime while encoding continues.
 pub(crate) struct S3StorageBackend {
     scheme: String,
     io_config: IOConfig,
@@ -55,6 +55,8 @@ def test_empty_parquet_write_without_partitioning(tmp_path, write_mode, with_mor
     assert_df_equals(df.to_pandas(), read_back_pd_df)
 
     assert len(pd_df) == 1
+    assert pd_df._preview.partition is None
+    pd_df.__repr__()
     assert len(pd_df._preview.partition) == 1
 
 
@@ -70,6 +72,8 @@ def test_empty_parquet_write_with_partitioning(tmp_path, write_mode, with_morsel
     assert_df_equals(df.to_pandas(), read_back_pd_df)
 
     assert len(output_files) == 1
+    assert output_files._preview.partition is None
+    output_files.__repr__()
     assert len(output_files._preview.partition) == 1
 
 
@@ -264,6 +268,8 @@ def test_empty_csv_write(tmp_path, with_morsel_size):
     assert_df_equals(df.to_pandas().fillna(""), read_back_pd_df.fillna(""))
 
     assert len(pd_df) == 1
+    assert pd_df._preview.partition is None
+    pd_df.__repr__()
     assert len(pd_df._preview.partition) == 1
 
 
@@ -282,6 +288,8 @@ def test_empty_csv_write_with_partitioning(tmp_path, with_morsel_size):
     assert_df_equals(df.to_pandas().fillna(""), read_back_pd_df.fillna(""))
 
     assert len(pd_df) == 1
+    assert pd_df._preview.partition is None
+    pd_df.__repr__()
     assert len(pd_df._preview.partition) == 1
 
 
@@ -84,6 +84,8 @@ def test_create_dataframe_empty_list() -> None:
 def test_create_dataframe_list(valid_data: list[dict[str, float]]) -> None:
     df = daft.from_pylist(valid_data)
     assert len(df) == len(valid_data)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == len(valid_data)
     assert set(df.column_names) == set(COL_NAMES)
 
@@ -92,6 +94,8 @@ def test_create_dataframe_list_data_longer_than_preview(valid_data: list[dict[st
     valid_data = valid_data * 3
     df = daft.from_pylist(valid_data)
     assert len(df) == len(valid_data)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == 8
     assert set(df.column_names) == set(COL_NAMES)
 
@@ -136,6 +140,8 @@ def test_create_dataframe_pydict(valid_data: list[dict[str, float]]) -> None:
     pydict = {k: [item[k] for item in valid_data] for k in valid_data[0].keys()}
     df = daft.from_pydict(pydict)
     assert len(df) == len(valid_data)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == len(valid_data)
     assert set(df.column_names) == set(COL_NAMES)
 
@@ -145,6 +151,8 @@ def test_create_dataframe_pydict_data_longer_than_preview(valid_data: list[dict[
     pydict = {k: [item[k] for item in valid_data] for k in valid_data[0].keys()}
     df = daft.from_pydict(pydict)
     assert len(df) == len(valid_data)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == 8
     assert set(df.column_names) == set(COL_NAMES)
 
@@ -180,6 +188,8 @@ def test_create_dataframe_arrow(valid_data: list[dict[str, float]], multiple) ->
     if multiple:
         t = pa.concat_tables(t)
     assert len(df) == len(t)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == (8 if multiple else len(t))
     assert set(df.column_names) == set(t.column_names)
     casted_field = t.schema.field("variety").with_type(pa.large_string())
@@ -274,6 +284,8 @@ def test_create_dataframe_pandas(valid_data: list[dict[str, float]], multiple) -
     if multiple:
         pd_df = pd.concat(pd_df).reset_index(drop=True)
     assert len(df) == len(pd_df)
+    assert df._preview.partition is None
+    df.__repr__()
     assert len(df._preview.partition) == (8 if multiple else len(pd_df))
     assert set(df.column_names) == set(pd_df.columns)
     # Check roundtrip.
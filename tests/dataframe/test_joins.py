@@ -1398,3 +1398,88 @@ def test_self_join_with_projection():
     }
 
     assert pa.Table.from_pydict(result_df.to_pydict()) == pa.Table.from_pydict(expected)
+
+
+@pytest.mark.parametrize("n_partitions", [1, 4])
+def test_skew_hints_matches_unsalted_join(make_df, n_partitions: int, with_morsel_size):
+    left = make_df(
+        {
+            "id": [1, 1, 1, 1, 2, 3, None],
+            "left_val": ["a", "b", "c", "d", "e", "f", "g"],
+        },
+        repartition=n_partitions,
+        repartition_columns=["id"],
+    )
+    right = make_df(
+        {
+            "id": [1, 2, 2, None],
+            "right_val": ["w", "x", "y", "z"],
+        },
+        repartition=n_partitions,
+        repartition_columns=["id"],
+    )
+
+    expected = left.join(right, on="id", how="inner")
+    salted = left.join(right, on="id", how="inner", skew_hints={"id": [1]})
+
+    assert salted.column_names == expected.column_names
+    assert sort_arrow_table(
+        pa.Table.from_pydict(salted.to_pydict()), "id", "left_val", "right_val"
+    ) == sort_arrow_table(pa.Table.from_pydict(expected.to_pydict()), "id", "left_val", "right_val")
+
+
+@pytest.mark.parametrize("n_partitions", [1, 4])
+def test_skew_hints_multicol_matches_unsalted_join(make_df, n_partitions: int, with_morsel_size):
+    left = make_df(
+        {
+            "A": [1, 1, 1, 2, 2, None],
+            "B": ["x", "x", "y", "y", "y", "x"],
+            "left_val": [1, 2, 3, 4, 5, 6],
+        },
+        repartition=n_partitions,
+        repartition_columns=["A"],
+    )
+    right = make_df(
+        {
+            "A": [1, 2, 2, None],
+            "B": ["x", "y", "z", "x"],
+            "right_val": [10, 20, 30, 40],
+        },
+        repartition=n_partitions,
+        repartition_columns=["A"],
+    )
+
+    expected = left.join(right, on=["A", "B"], how="inner")
+    salted = left.join(right, on=["A", "B"], how="inner", skew_hints={"A": [1, 2]})
+
+    assert salted.column_names == expected.column_names
+    assert sort_arrow_table(
+        pa.Table.from_pydict(salted.to_pydict()), "A", "B", "left_val", "right_val"
+    ) == sort_arrow_table(pa.Table.from_pydict(expected.to_pydict()), "A", "B", "left_val", "right_val")
+
+
+def test_skew_hints_on_non_key_column_falls_back():
+    left = daft.from_pydict({"id": [1, 2], "v": [10, 20]})
+    right = daft.from_pydict({"id": [1, 2], "w": [30, 40]})
+
+    # A hint on a column that isn't a join key can't be salted, so the salted planner bails out...
+    assert left._salted_join(right, on="id", strategy=None, prefix=None, suffix=None, skew_hints={"v": [10]}) is None
+
+    # ...and the public join still takes the normal path and produces the right answer.
+    joined = left.join(right, on="id", how="inner", skew_hints={"v": [10]}).sort("id")
+    assert joined.to_pydict() == {"id": [1, 2], "v": [10, 20], "w": [30, 40]}
+
+
+def test_skew_hints_reserved_column_names_fall_back():
+    right = daft.from_pydict({"id": [1, 2], "w": [30, 40]})
+
+    # The salt and row-id columns are reserved; frames that already use those names can't be salted.
+    salted_left = daft.from_pydict({"id": [1, 2], "__daft_join_salt": [0, 0]})
+    assert salted_left._salted_join(right, on="id", strategy=None, prefix=None, suffix=None, skew_hints={"id": [1]}) is None
+
+    row_id_left = daft.from_pydict({"id": [1, 2], "__daft_join_salt_row_id": [0, 0]})
+    assert row_id_left._salted_join(right, on="id", strategy=None, prefix=None, suffix=None, skew_hints={"id": [1]}) is None
+
+    # The public join still succeeds via the unsalted path.
+    joined = salted_left.join(right, on="id", how="inner", skew_hints={"id": [1]}).sort("id")
+    assert joined.to_pydict() == {"id": [1, 2], "__daft_join_salt": [0, 0], "w": [30, 40]}